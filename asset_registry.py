@@ -0,0 +1,72 @@
+import os
+import pygame
+
+#process-wide image cache: every file is decoded and converted once, and derived
+#versions (flips, tints) are made once, then the same surface is handed to every caller.
+#surfaces from here are shared, so never draw onto them - copy() first if you need to
+class AssetRegistry:
+    def __init__(self):
+        self._surfaces = {}
+        self._dir_listings = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _resolve(self, path: str) -> str:
+        #sprite names in code don't always match the file's case ("idle" vs Idle.png),
+        #which only matters on case-sensitive filesystems
+        if os.path.exists(path):
+            return path
+        directory, filename = os.path.split(path)
+        if directory not in self._dir_listings:
+            try:
+                self._dir_listings[directory] = {name.lower(): name for name in os.listdir(directory or ".")}
+            except FileNotFoundError:
+                self._dir_listings[directory] = {}
+        match = self._dir_listings[directory].get(filename.lower())
+        return os.path.join(directory, match) if match else path
+
+    def get_or_create(self, key, factory):
+        #generic memoization for anything derived or generated (tinted tiles, orb glows, ...)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = factory()
+        self._surfaces[key] = surface
+        return surface
+
+    def image(self, path: str, alpha: bool = True) -> pygame.Surface:
+        def load():
+            loaded = pygame.image.load(self._resolve(path))
+            return loaded.convert_alpha() if alpha else loaded.convert()
+        return self.get_or_create(("image", path, alpha), load)
+
+    def flipped(self, path: str, flip_x: bool, flip_y: bool) -> pygame.Surface:
+        if not flip_x and not flip_y:
+            return self.image(path)
+        return self.get_or_create(("flipped", path, flip_x, flip_y),
+                                  lambda: pygame.transform.flip(self.image(path), flip_x, flip_y))
+
+    def tinted(self, path: str, color: tuple) -> pygame.Surface:
+        def tint():
+            surface = self.image(path).copy()
+            surface.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+            return surface
+        return self.get_or_create(("tinted", path, tuple(color)), tint)
+
+    def solid(self, size: tuple, color: tuple) -> pygame.Surface:
+        #plain coloured rectangles; entities that change colour swap between these instead of fill()ing their own
+        def create():
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            return surface
+        return self.get_or_create(("solid", tuple(size), tuple(color)), create)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "surfaces": len(self._surfaces)}
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+ASSETS = AssetRegistry()
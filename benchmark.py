@@ -0,0 +1,204 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") #no window needed
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+import pygame
+
+from constants import CONFIG, NUM_LEVELS
+from language_manager import LANG
+
+#benchmarks for every shipped level: loading, the parts of an update, drawing at a few zoom
+#levels and orb texture generation. results go to JSON; --compare flags regressions against a baseline.
+#usage: python benchmark.py [--levels 1 4] [--ticks 600] [--out results.json] [--compare baseline.json]
+
+ZOOMS = (0.5, 1.0, 2.0)
+
+def scripted_inputs(level_num: int, ticks: int, recordings: str = None) -> list:
+    #a recorded traversal (DIR/levelN.rec from game.py --record) if there is one, else seeded random input
+    from simulation import InputFrame
+    from replay import InputReplay, decode_input
+    if recordings:
+        path = os.path.join(recordings, f"level{level_num}.rec")
+        if os.path.exists(path):
+            return [decode_input(bits)[0] for bits, _ in InputReplay(path).records][:ticks]
+    rng = random.Random(level_num)
+    return [InputFrame(left=rng.random() < 0.15, right=rng.random() < 0.7, sprint=rng.random() < 0.4,
+                       jump=rng.random() < 0.08, flip=rng.random() < 0.02) for _ in range(ticks)]
+
+class PhaseTimer:
+    #wraps a method/staticmethod so every call adds its duration to a total
+    def __init__(self, owner, name: str, static: bool = False):
+        self.owner = owner
+        self.name = name
+        self.static = static
+        self.original = owner.__dict__[name]
+        self.total = 0.0
+        self.calls = 0
+
+    def __enter__(self):
+        function = self.original.__func__ if self.static else self.original
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.total += time.perf_counter() - start
+                self.calls += 1
+        setattr(self.owner, self.name, staticmethod(timed) if self.static else timed)
+        return self
+
+    def __exit__(self, *exc):
+        setattr(self.owner, self.name, self.original)
+
+    def per_call_us(self) -> float:
+        return self.total / self.calls * 1e6 if self.calls else 0.0
+
+def bench_load(level_num: int, repeats: int) -> dict:
+    from level import LevelLoader
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        LevelLoader.load(level_num)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    level = LevelLoader.load(level_num)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "load_ms": statistics.median(times) * 1000,
+        "load_python_peak_kb": peak / 1024, #python-side allocations only, surfaces live in SDL's heap
+        "sprites": len(level.all_sprites),
+        "platform_colliders": len(level.platform_colliders)
+    }
+
+def bench_update(level_num: int, inputs: list) -> dict:
+    from simulation import Simulation
+    from collision_system import CollisionSystem
+    from entities.player import Player
+    simulation = Simulation(level_num)
+    with PhaseTimer(Player, "apply_physics") as physics, \
+         PhaseTimer(Simulation, "_handle_horizontal_collision") as horizontal, \
+         PhaseTimer(CollisionSystem, "handle_collisions", static=True) as collisions:
+        start = time.perf_counter()
+        for frame in inputs:
+            simulation.step(frame) #keeps going through teleports/boss catches, we only want the cost
+        total = time.perf_counter() - start
+    return {
+        "ticks": len(inputs),
+        "update_us": total / max(1, len(inputs)) * 1e6,
+        "apply_physics_us": physics.per_call_us(),
+        "horizontal_collision_us": horizontal.per_call_us(),
+        "handle_collisions_us": collisions.per_call_us()
+    }
+
+def bench_draw(level_num: int, inputs: list, screen: pygame.Surface, frames: int) -> dict:
+    from game_states.state_manager import StateManager
+    from game_states.play import GameStatePlay
+    from simulation import Simulation
+    #camera positions along the scripted run, so the view covers what a player would see
+    simulation = Simulation(level_num)
+    positions = []
+    for frame in inputs:
+        simulation.step(frame)
+        positions.append(simulation.level.player.rect.topleft)
+    step = max(1, len(positions) // frames)
+    positions = positions[::step][:frames] or [(400, 300)]
+
+    results = {}
+    state = GameStatePlay(StateManager(), level_num, seed=0)
+    render_mode = CONFIG.render_mode
+    for mode, prefix in (("direct", "draw_ms"), ("scaled", "draw_scaled_ms")):
+        CONFIG.render_mode = mode
+        for zoom in ZOOMS:
+            state.zoom = zoom
+            state.draw(screen) #warm caches for this zoom
+            start = time.perf_counter()
+            for position in positions:
+                state.level.player.rect.topleft = position
+                state.draw(screen)
+            results[f"{prefix}_zoom_{zoom}"] = (time.perf_counter() - start) / len(positions) * 1000
+    CONFIG.render_mode = render_mode
+    return results
+
+def bench_orbs(repeats: int) -> dict:
+    from entities.orbs import Orb
+    start = time.perf_counter()
+    for _ in range(repeats):
+        Orb._render_glow(75, (0, 255, 255), 1.5)
+    generate = (time.perf_counter() - start) / repeats
+    orb = Orb(0, 0)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        orb._create_image((0, 255, 255))
+    cached = (time.perf_counter() - start) / repeats
+    return {"orb_generate_ms": generate * 1000, "orb_create_image_cached_us": cached * 1e6}
+
+def run(level_nums, ticks: int, frames: int, repeats: int, recordings: str = None) -> dict:
+    pygame.init()
+    screen = pygame.display.set_mode((CONFIG.WIDTH, CONFIG.HEIGHT))
+    LANG.load_languages()
+    results = {
+        "meta": {"resolution": [CONFIG.WIDTH, CONFIG.HEIGHT], "ticks": ticks, "frames": frames,
+                 "python": sys.version.split()[0], "pygame": pygame.version.ver},
+        "orbs": bench_orbs(repeats * 5),
+        "levels": {}
+    }
+    for level_num in level_nums:
+        inputs = scripted_inputs(level_num, ticks, recordings)
+        level_result = bench_load(level_num, repeats)
+        level_result.update(bench_update(level_num, inputs))
+        level_result.update(bench_draw(level_num, inputs, screen, frames))
+        results["levels"][str(level_num)] = level_result
+        print(f"level {level_num}: " + ", ".join(f"{key}={value:.2f}" for key, value in level_result.items()
+                                                  if isinstance(value, float)))
+    return results
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    #timings/memory that grew by more than threshold (0.15 = 15%); counts are informational and skipped
+    regressions = []
+    def check(path, new, old):
+        for key, value in new.items():
+            if not isinstance(value, float) or not isinstance(old.get(key), (int, float)) or old[key] <= 0:
+                continue
+            change = value / old[key] - 1
+            if change > threshold:
+                regressions.append(f"{path}{key}: {old[key]:.2f} -> {value:.2f} (+{change:.0%})")
+    check("orbs.", results["orbs"], baseline.get("orbs", {}))
+    for level_num, level_result in results["levels"].items():
+        check(f"level{level_num}.", level_result, baseline.get("levels", {}).get(level_num, {}))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-level load/update/draw benchmarks")
+    parser.add_argument("--levels", type=int, nargs="+", default=list(range(1, NUM_LEVELS + 1)))
+    parser.add_argument("--ticks", type=int, default=600, help="simulated updates per level")
+    parser.add_argument("--frames", type=int, default=60, help="drawn frames per level and zoom")
+    parser.add_argument("--repeats", type=int, default=3, help="level loads to take the median of")
+    parser.add_argument("--recordings", metavar="DIR", help="use DIR/levelN.rec input recordings where present")
+    parser.add_argument("--out", default="benchmark_results.json")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against an earlier results file")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown before flagging")
+    args = parser.parse_args(argv)
+
+    results = run(args.levels, args.ticks, args.frames, args.repeats, args.recordings)
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for line in regressions:
+            print("REGRESSION " + line)
+        if regressions:
+            return 1
+        print("No regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
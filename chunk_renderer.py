@@ -0,0 +1,73 @@
+import pygame
+
+CHUNK_SIZE = 510 #world pixels per chunk side, a multiple of the 30px tile so scaled chunks stay whole pixels
+
+#bakes sprites that never change (platforms, spikes, signs, teleporters) into a few large surfaces
+#once per level, so drawing the static layer is a handful of blits instead of one per tile
+class ChunkRenderer:
+    def __init__(self, sprites: pygame.sprite.Group, chunk_size: int = CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.chunks = {} #(col, row) -> baked surface
+        self.build(sprites)
+
+    def _chunk_range(self, rect: pygame.Rect):
+        size = self.chunk_size
+        return (rect.left // size, (rect.right - 1) // size,
+                rect.top // size, (rect.bottom - 1) // size)
+
+    def build(self, sprites) -> None:
+        self.chunks = {}
+        self._bake(sprites)
+
+    def refresh(self, sprites, rects) -> None:
+        #re-bakes only the chunks touching rects (world areas that changed) into new surfaces,
+        #so per-zoom copies of the old ones in a ScaledCache are simply no longer asked for
+        keys = set()
+        for rect in rects:
+            left, right, top, bottom = self._chunk_range(rect)
+            keys.update((col, row) for col in range(left, right + 1) for row in range(top, bottom + 1))
+        for key in keys:
+            self.chunks.pop(key, None)
+        self._bake(sprites, keys)
+
+    def _bake(self, sprites, keys: set = None) -> None:
+        #sprites are baked in group order, so later sprites end up on top like before;
+        #keys limits baking to those chunks
+        size = self.chunk_size
+        for sprite in sprites:
+            left, right, top, bottom = self._chunk_range(sprite.rect)
+            for col in range(left, right + 1):
+                for row in range(top, bottom + 1):
+                    if keys is not None and (col, row) not in keys:
+                        continue
+                    chunk = self.chunks.get((col, row))
+                    if chunk is None:
+                        chunk = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+                        self.chunks[(col, row)] = chunk
+                    chunk.blit(sprite.image, (sprite.rect.x - col * size, sprite.rect.y - row * size))
+
+    def draw(self, surface: pygame.Surface, camera: tuple, view_width: float, view_height: float) -> None:
+        size = self.chunk_size
+        view = pygame.Rect(int(camera[0]), int(camera[1]), int(view_width) + 1, int(view_height) + 1)
+        left, right, top, bottom = self._chunk_range(view)
+        for col in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                chunk = self.chunks.get((col, row))
+                if chunk is not None:
+                    surface.blit(chunk, (col * size - camera[0], row * size - camera[1]))
+
+    def draw_scaled(self, surface: pygame.Surface, camera: tuple, zoom: float, cache) -> None:
+        #straight onto the screen at zoom, chunks come pre-scaled from cache (a ScaledCache).
+        #chunk edges are rounded from world coordinates so neighbouring chunks meet without gaps
+        size = self.chunk_size
+        offset_x = round(camera[0] * zoom)
+        offset_y = round(camera[1] * zoom)
+        view = pygame.Rect(int(camera[0]), int(camera[1]),
+                           int(surface.get_width() / zoom) + 2, int(surface.get_height() / zoom) + 2)
+        left, right, top, bottom = self._chunk_range(view)
+        for col in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                chunk = self.chunks.get((col, row))
+                if chunk is not None:
+                    surface.blit(cache.get(chunk, zoom),
+                                 (round(col * size * zoom) - offset_x, round(row * size * zoom) - offset_y))
@@ -1,51 +1,71 @@
 import pygame
+from collections import namedtuple
 from entities.player import Player
 from entities.checkpoint import Checkpoint
 from level import Level
-from game_states.state_manager import StateManager
 from entities.boss import Boss
-from constants import COLORS, NUM_LEVELS
+
+#something gameplay-relevant that happened during an update: kind is one of
+#"teleport" (data = target level), "death", "checkpoint", "orb", "boss" (player caught), "flip"
+GameEvent = namedtuple("GameEvent", ["kind", "data"])
 
 class CollisionSystem: #check for touching objects
     @staticmethod
-    def handle_collisions(player: Player, level: Level, state_manager: StateManager) -> None:
-        teleporters = pygame.sprite.spritecollide(player, level.teleporters, False)
-        if teleporters:
-            teleporter=teleporters[0]
-            from game_states.story import GameStateStory
-            if teleporter.target_level > NUM_LEVELS:
-                #trigger ending story
-                state_manager.push_state(GameStateStory(state_manager, 99))
-            else:
-                state_manager.pop_state()
-                state_manager.push_state(GameStateStory(state_manager, teleporter.target_level))
-
-        if pygame.sprite.spritecollide(player, level.spikes, False):
-            player.reset_position()
-
-        for orb in pygame.sprite.spritecollide(player, level.orbs, False):
-            if orb.active and player.charged == False:
-                orb.deactivate()
-                player.charged = True
-        level.active_sign = None
-        for sign in level.signs:
-            distance = pygame.math.Vector2(sign.rect.center).distance_to(player.rect.center)
-            if distance < sign.detection_radius:
-                level.active_sign = sign
-                break
-        for checkpoint in pygame.sprite.spritecollide(player, level.checkpoints, False):
-            if checkpoint.active:
-                checkpoint.deactivate()
-                
-                #deactivate previous checkpoint
-                if level.active_checkpoint:
-                    level.active_checkpoint.active = True
-                    level.active_checkpoint.image.fill(COLORS["GREEN"])
-                
-                #set new checkpoint
-                level.active_checkpoint = checkpoint
-                player.set_reset_position(checkpoint.rect.x, checkpoint.rect.y)
-        for boss in pygame.sprite.spritecollide(player, level.bosses, False):
+    def handle_collisions(player: Player, level: Level) -> list:
+        #applies everything that only touches the level and player, and reports the rest
+        #(teleports, boss catches) as events for whoever owns the game states
+        events = []
+        level.triggers.update(player, CollisionSystem.HANDLERS, level, events)
+        for boss in pygame.sprite.spritecollide(player, level.bosses, False): #bosses move, so no trigger volume
             if boss.active:
-                from game_states.story import GameStateStory
-                state_manager.push_state(GameStateStory(state_manager, 98))
+                events.append(GameEvent("boss", boss))
+        return events
+
+    @staticmethod
+    def _teleport(teleporter, player: Player, level: Level, events: list) -> None:
+        #only the first teleporter in level order counts, like the old teleporters[0]; a second
+        #event would make the play state leave the level twice
+        if not any(event.kind == "teleport" for event in events):
+            events.append(GameEvent("teleport", teleporter.target_level))
+
+    @staticmethod
+    def _spike(spike, player: Player, level: Level, events: list) -> None:
+        player.reset_position()
+        events.append(GameEvent("death", None))
+
+    @staticmethod
+    def _orb(orb, player: Player, level: Level, events: list) -> None:
+        if orb.active and player.charged == False:
+            orb.deactivate()
+            player.charged = True
+            events.append(GameEvent("orb", orb))
+
+    @staticmethod
+    def _sign(sign, player: Player, level: Level, events: list) -> None:
+        #the first sign in range (in level order) is the one shown
+        inside = level.triggers.inside["sign"]
+        level.active_sign = inside[0].entity if inside else None
+
+    @staticmethod
+    def _checkpoint(checkpoint, player: Player, level: Level, events: list) -> None:
+        if checkpoint.active:
+            checkpoint.deactivate()
+            
+            #deactivate previous checkpoint
+            if level.active_checkpoint:
+                level.active_checkpoint.activate()
+            
+            #set new checkpoint
+            level.active_checkpoint = checkpoint
+            player.set_reset_position(checkpoint.rect.x, checkpoint.rect.y)
+            events.append(GameEvent("checkpoint", checkpoint))
+
+#kind -> (on_enter, on_stay, on_exit) for TriggerSystem.update. everything except signs acts
+#on every update the player overlaps it, like the old per-frame spritecollide checks did
+CollisionSystem.HANDLERS = {
+    "teleport": (CollisionSystem._teleport, CollisionSystem._teleport, None),
+    "spike": (CollisionSystem._spike, CollisionSystem._spike, None),
+    "orb": (CollisionSystem._orb, CollisionSystem._orb, None),
+    "sign": (CollisionSystem._sign, None, CollisionSystem._sign),
+    "checkpoint": (CollisionSystem._checkpoint, CollisionSystem._checkpoint, None),
+}
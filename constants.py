@@ -8,7 +8,10 @@ PLAYER_SPEED = 5
 SPRINT_SPEED = 8
 SPRINT_ACCELERATION = 1.2
 NUM_LEVELS = 9
+TICK_RATE = 60 #fixed simulation updates per second, every per-update constant above is tuned for it
+MAX_FRAME_TIME = 0.25 #seconds of simulation a single slow frame may catch up on
 BG_IMAGE_PATH="assets/images/background.png"
+FONT_PATH="fonts/Silver.ttf"
 
 COLORS = {
     "WHITE": (255, 255, 255),
@@ -20,6 +23,7 @@ COLORS = {
     "BLUE": (0, 0, 255),
     "YELLOW": (255, 255, 0),
     "PLATFORM": (100, 100, 100),
+    "PLATFORM_EDGE": (60, 60, 60),
     "MENU_BG": (30, 30, 50),
     "BUTTON": (70, 70, 90),
     "BUTTON_HOVER": (100, 100, 120),
@@ -33,6 +37,8 @@ class GameConfig:
         self._height = 600
         self.fullscreen = False
         self.fps = 60
+        self.render_mode = "direct" #"direct": scaled sprites straight to the screen, "scaled": draw at 1x and scale the frame
+        self.dev_mode = False #set by game.py --dev, not saved: reloads level files while playing them
         self.LANGUAGE = "en"
         self.load_config()
         
@@ -62,7 +68,9 @@ class GameConfig:
             "width": self._width,
             "height": self._height,
             "language": self.LANGUAGE,
-            "fullscreen": self.fullscreen
+            "fullscreen": self.fullscreen,
+            "fps": self.fps,
+            "render_mode": self.render_mode
         }
         os.makedirs("config", exist_ok=True)
         with open("config/settings.json", "w") as f:
@@ -76,6 +84,8 @@ class GameConfig:
                 self._height = config_data.get("height", 600)
                 self.LANGUAGE = config_data.get("language", "en")
                 self.fullscreen = config_data.get("fullscreen", False)
+                self.fps = config_data.get("fps", 60)
+                self.render_mode = config_data.get("render_mode", "direct")
         except FileNotFoundError:
             pass
 
@@ -2,25 +2,28 @@ import pygame
 import math
 from entities.game_object import GameObject
 from constants import COLORS
+from asset_registry import ASSETS
 
 class Boss(GameObject):
     def __init__(self, x: int, y: int, speed: float = 3.0):
         super().__init__(x, y)
-        self.image = pygame.Surface((120, 2000))
-        self.image.fill(COLORS["RED"])
+        self.image = ASSETS.solid((120, 2000), COLORS["RED"])
         self.rect = self.image.get_rect(topleft=(x, y))
         self.speed = speed
         self.detection_range = 1000 #pixels where boss can detect player
         self.active = False
         
+    def activate(self) -> None:
+        self.active = True
+        self.image = ASSETS.solid((120, 2000), COLORS["DARK_RED"])
+
     def update(self, player_rect: pygame.Rect) -> None:
         #activate boss if player is within detection range
         if not self.active:
             distance = math.sqrt((self.rect.centerx - player_rect.centerx)**2 + 
                                (self.rect.centery - player_rect.centery)**2)
             if distance < self.detection_range:
-                self.active = True
-                self.image.fill(COLORS["DARK_RED"])
+                self.activate()
             return
         
         #chase player when active
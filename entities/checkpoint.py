@@ -1,15 +1,19 @@
 import pygame
 from entities.game_object import GameObject
 from constants import COLORS
+from asset_registry import ASSETS
 
 class Checkpoint(GameObject):
     def __init__(self, x: int, y: int):
         super().__init__(x, y)
-        self.image = pygame.Surface((30, 30))
-        self.image.fill(COLORS["GREEN"]) #active color
+        self.image = ASSETS.solid((30, 30), COLORS["GREEN"]) #active color
         self.rect = self.image.get_rect(topleft=(x, y))
         self.active = True
     
+    def activate(self):
+        self.active = True
+        self.image = ASSETS.solid((30, 30), COLORS["GREEN"])
+
     def deactivate(self):
         self.active = False
-        self.image.fill(COLORS["TRANSPARENT_ACCENT"]) #deactivated color
\ No newline at end of file
+        self.image = ASSETS.solid((30, 30), COLORS["TRANSPARENT_ACCENT"]) #deactivated color
\ No newline at end of file
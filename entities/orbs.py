@@ -1,7 +1,8 @@
 import pygame
+import numpy
 from entities.game_object import GameObject
-from constants import COLORS
-import math
+from constants import COLORS, TICK_RATE
+from asset_registry import ASSETS
 
 class Orb(GameObject):
     def __init__(self, x: int, y: int):
@@ -13,33 +14,44 @@ class Orb(GameObject):
         self.image = self.active_image
         self.rect = self.image.get_rect(center=(x + 15, y + 15))
         self.active = True
-        self.respawn_time = 0
+        self.respawn_ticks = 0
 
     def _create_image(self, color: tuple) -> pygame.Surface:
-        surface = pygame.Surface((self.diameter, self.diameter), pygame.SRCALPHA)
-        
         blur_factor = 1.5 #to adjust blur strength
-        
-        for y in range(self.diameter):
-            for x in range(self.diameter):
-                #distance from the center
-                dist = math.sqrt((x - self.radius) ** 2 + (y - self.radius) ** 2)
-                
-                if dist < self.radius:
-                    #blur calculation
-                    intensity = 255 - int((dist / self.radius) ** blur_factor * 255)
-                    surface.set_at((x, y), (*color[:3], intensity))
-                else:
-                    surface.set_at((x, y), (0, 0, 0, 0)) #fully transparent outside the circle
+        #every orb with the same look shares one texture
+        key = ("orb_glow", self.diameter, tuple(color[:3]), blur_factor)
+        return ASSETS.get_or_create(key, lambda: Orb._render_glow(self.diameter, color, blur_factor))
+
+    @staticmethod
+    def _render_glow(diameter: int, color: tuple, blur_factor: float) -> pygame.Surface:
+        surface = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+        radius = diameter // 2
+
+        #distance from the center for every pixel at once, indexed [x, y] like surfarray
+        offsets = numpy.arange(diameter) - radius
+        dist = numpy.sqrt(offsets[:, None] ** 2 + offsets[None, :] ** 2)
+        inside = dist < radius
+
+        #blur calculation, fully transparent outside the circle
+        alpha = numpy.where(inside, 255 - numpy.floor((dist / radius) ** blur_factor * 255), 0)
+
+        rgb = pygame.surfarray.pixels3d(surface)
+        rgb[inside] = color[:3]
+        del rgb #release the surface lock
+        pixels_alpha = pygame.surfarray.pixels_alpha(surface)
+        pixels_alpha[:] = alpha.astype(numpy.uint8)
+        del pixels_alpha
         return surface
 
     def deactivate(self) -> None: #orbs deactivate on touch, reactivate after certain time
         if self.active:
             self.active = False
             self.image = self.inactive_image
-            self.respawn_time = pygame.time.get_ticks() + 2000 #2 seconds
+            self.respawn_ticks = 2 * TICK_RATE #2 seconds of simulation
 
     def update(self) -> None:
-        if not self.active and pygame.time.get_ticks() > self.respawn_time:
-            self.active = True
-            self.image = self.active_image
+        if not self.active:
+            self.respawn_ticks -= 1
+            if self.respawn_ticks <= 0:
+                self.active = True
+                self.image = self.active_image
@@ -0,0 +1,73 @@
+import numpy
+import pygame
+
+#fixed-capacity particle pool: positions, velocities, ages and alphas live in flat arrays and
+#advance in one vectorized step per update, and particles draw from a few textures baked up
+#front, so bursts of effects (speedlines, deaths, pickups) never allocate surfaces or sprites.
+#when the pool is full new particles are dropped rather than growing it
+class ParticlePool:
+    def __init__(self, capacity: int = 512):
+        self.capacity = capacity
+        self.position = numpy.zeros((capacity, 2)) #centre, world pixels
+        self.velocity = numpy.zeros((capacity, 2)) #pixels per update
+        self.age = numpy.zeros(capacity, numpy.int32)
+        self.lifetime = numpy.ones(capacity, numpy.int32)
+        self.start_alpha = numpy.zeros(capacity, numpy.int32)
+        self.alpha = numpy.zeros(capacity, numpy.int32) #start alpha faded out over the lifetime
+        self.texture = numpy.zeros(capacity, numpy.int32)
+        self.alive = numpy.zeros(capacity, bool)
+        self.textures = []
+        self._free = list(range(capacity - 1, -1, -1)) #free slots, lowest index on top
+
+    def add_texture(self, surface: pygame.Surface) -> int:
+        #the pool sets the texture's alpha per particle while drawing, so don't share it with sprites
+        self.textures.append(surface)
+        return len(self.textures) - 1
+
+    def emit(self, position, velocity, lifetime: int, texture: int, alpha: int = 255) -> bool:
+        if not self._free:
+            return False
+        i = self._free.pop()
+        self.position[i] = position
+        self.velocity[i] = velocity
+        self.age[i] = 0
+        self.lifetime[i] = lifetime
+        self.start_alpha[i] = alpha
+        self.alpha[i] = alpha
+        self.texture[i] = texture
+        self.alive[i] = True
+        return True
+
+    def update(self) -> None:
+        alive = self.alive
+        if not alive.any():
+            return
+        self.position[alive] += self.velocity[alive]
+        self.age[alive] += 1
+        expired = alive & (self.age >= self.lifetime)
+        if expired.any():
+            alive[expired] = False
+            self._free.extend(numpy.flatnonzero(expired)[::-1].tolist())
+        #linear fade, same as set_alpha(255 - 255 * age / lifetime) on top of the start alpha
+        self.alpha[:] = self.start_alpha * (255 - 255 * self.age // self.lifetime) // 255
+
+    def draw(self, surface: pygame.Surface, camera: tuple, zoom: float = 1.0, cache=None) -> None:
+        #cache (a ScaledCache) supplies scaled textures when drawing straight to the screen at zoom
+        offset_x = round(camera[0] * zoom)
+        offset_y = round(camera[1] * zoom)
+        textures = self.textures
+        for i in numpy.flatnonzero(self.alive).tolist():
+            texture = textures[self.texture[i]]
+            if cache is not None:
+                texture = cache.get(texture, zoom)
+            texture.set_alpha(int(self.alpha[i]))
+            x, y = self.position[i]
+            surface.blit(texture, (round(x * zoom) - offset_x - texture.get_width() // 2,
+                                   round(y * zoom) - offset_y - texture.get_height() // 2))
+
+    def clear(self) -> None:
+        self.alive[:] = False
+        self._free = list(range(self.capacity - 1, -1, -1))
+
+    def __len__(self) -> int:
+        return self.capacity - len(self._free)
@@ -1,10 +1,45 @@
 import pygame
 from entities.game_object import GameObject
+from asset_registry import ASSETS
+from constants import COLORS
 import os
 
+#neighbour bits for Platform edges: set when another platform tile touches that side
+UP, RIGHT, DOWN, LEFT = 1, 2, 4, 8
+
 class Platform(GameObject):
-    def __init__(self, x: int, y: int):
+    def __init__(self, x: int, y: int, neighbours: int = UP | RIGHT | DOWN | LEFT):
         super().__init__(x, y)
         sprite_path = os.path.join("assets", "images", "platform.png")
-        self.image = pygame.image.load(sprite_path).convert_alpha()
+        self.neighbours = neighbours
+        self.image = Platform._tile_image(sprite_path, neighbours)
         self.rect = self.image.get_rect(topleft=(x, y))
+
+    def set_neighbours(self, neighbours: int) -> bool:
+        #returns whether the image changed
+        if neighbours == self.neighbours:
+            return False
+        self.neighbours = neighbours
+        self.image = Platform._tile_image(os.path.join("assets", "images", "platform.png"), neighbours)
+        return True
+
+    @staticmethod
+    def _tile_image(sprite_path: str, neighbours: int) -> pygame.Surface:
+        #autotile: a dark rim on every side that isn't joined to another platform, one shared
+        #variant per neighbour mask (16 at most)
+        if neighbours == UP | RIGHT | DOWN | LEFT:
+            return ASSETS.image(sprite_path)
+        def outline():
+            surface = ASSETS.image(sprite_path).copy()
+            width, height = surface.get_size()
+            rim = 2
+            if not neighbours & UP:
+                surface.fill(COLORS["PLATFORM_EDGE"], (0, 0, width, rim))
+            if not neighbours & RIGHT:
+                surface.fill(COLORS["PLATFORM_EDGE"], (width - rim, 0, rim, height))
+            if not neighbours & DOWN:
+                surface.fill(COLORS["PLATFORM_EDGE"], (0, height - rim, width, rim))
+            if not neighbours & LEFT:
+                surface.fill(COLORS["PLATFORM_EDGE"], (0, 0, rim, height))
+            return surface
+        return ASSETS.get_or_create(("platform_edges", sprite_path, neighbours), outline)
@@ -1,12 +1,15 @@
 import pygame
 import os
 from entities.game_object import GameObject
+from spatial_grid import SpatialGrid
+from swept_collision import SweptCollision
+from asset_registry import ASSETS
 from constants import COLORS, GRAVITY, JUMP_STRENGTH, PLAYER_SPEED, SPRINT_SPEED, SPRINT_ACCELERATION
 
 class AnimationHandler:
     def __init__(self, base_path: str):
         self.animations_normal = self._load_animations(base_path)
-        self.animations_upside_down = self._create_upside_down_animations()
+        self.animations_upside_down = self._create_upside_down_animations(base_path)
         self.walk_frames = ["walk1", "idle", "walk2", "idle"]
         self.run_frames = ["Run1", "Run2", "Run1", "Run3"]
         self.animation_index = 0
@@ -19,28 +22,25 @@ class AnimationHandler:
             "JumpUp", "JumpDown", "JumpDownAlt"
         ]
         
-        #load right-facing frames
+        #frames and their mirrored copies are shared by every player through the registry
         right_frames = {}
-        for name in frame_names:
-            img = pygame.image.load(os.path.join(base_path, f"{name}.png")).convert_alpha()
-            right_frames[name] = img
-        
-        #load left-facing frames
         left_frames = {}
-        for name, img in right_frames.items():
-            left_frames[name] = pygame.transform.flip(img, True, False)
+        for name in frame_names:
+            path = os.path.join(base_path, f"{name}.png")
+            right_frames[name] = ASSETS.image(path)
+            left_frames[name] = ASSETS.flipped(path, True, False)
         
         return {
             "right": right_frames,
             "left": left_frames
         }
 
-    def _create_upside_down_animations(self) -> dict:
+    def _create_upside_down_animations(self, base_path: str) -> dict:
         upside_down = {}
         for direction in ["right", "left"]:
             upside_down[direction] = {
-                name: pygame.transform.flip(img, False, True)
-                for name, img in self.animations_normal[direction].items()
+                name: ASSETS.flipped(os.path.join(base_path, f"{name}.png"), direction == "left", True)
+                for name in self.animations_normal[direction]
             }
         return upside_down
 
@@ -66,6 +66,7 @@ class Player(GameObject):
         
         #physics
         self.velocity_y = 0
+        self.pending_dx = 0 #horizontal movement requested by update(), applied in apply_physics
         self.gravity_direction = 1
         self.on_ground = False
         self.charged = True
@@ -85,25 +86,25 @@ class Player(GameObject):
     def _get_current_animation_set(self) -> dict:
         return self.animation_handler.get_animation_set(self.gravity_direction)[self.direction]
 
-    def apply_physics(self, platforms: pygame.sprite.Group) -> None:
+    def apply_physics(self, platforms: SpatialGrid) -> None:
+        dx, self.pending_dx = self.pending_dx, 0
         if self.reset_cooldown > 0:
             self.reset_cooldown -= 1
+            SweptCollision.move(self.rect, dx, 0, platforms)
             return
 
         self.velocity_y += GRAVITY * self.gravity_direction
-        self._handle_vertical_collision(platforms)
+        self._handle_collisions(dx, platforms)
 
-    def _handle_vertical_collision(self, platforms: pygame.sprite.Group) -> None:
+    def _handle_collisions(self, dx: int, platforms: SpatialGrid) -> None:
+        #same vertical travel as the old per-pixel loop (int(|v|)+1 pixels), but one sweep instead of a step each
         step = int(abs(self.velocity_y)) + 1
         step_dir = 1 if self.velocity_y > 0 else -1
         self.on_ground = False
 
-        for _ in range(step):
-            self.rect.y += step_dir
-            for platform in platforms:
-                if self.rect.colliderect(platform.rect):
-                    self._resolve_vertical_collision(platform, step_dir)
-                    return
+        _, hit_y = SweptCollision.move(self.rect, dx, step * step_dir, platforms)
+        if hit_y:
+            self._resolve_vertical_collision(hit_y, step_dir)
 
     def _resolve_vertical_collision(self, platform: GameObject, step_dir: int) -> None:
         if self.gravity_direction == 1:
@@ -189,5 +190,5 @@ class Player(GameObject):
         elif x_velocity < 0:
             self.direction = "left"
 
-        self.rect.x += int(x_velocity)
+        self.pending_dx = int(x_velocity)
         self.update_animation(x_velocity)
\ No newline at end of file
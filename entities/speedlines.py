@@ -1,30 +1,26 @@
 import pygame
-import random
-from pygame.math import Vector2
 from constants import COLORS
 
-class Speedline(pygame.sprite.Sprite):
-    def __init__(self, position, direction):
-        super().__init__()
-        self.lifetime = 30 #frames
-        self.age = 0
-        
-        #random properties
-        length = random.randint(100,200) #from 100 to 200, vertical length
-        thickness = random.randint(1, 3) #1,2,3
-        self.image = pygame.Surface((thickness,length), pygame.SRCALPHA)
-        self.image.fill(COLORS["WHITE"] + (random.randint(150, 255),)) #a little transparent
-        
-        #set position and velocity
-        self.rect = self.image.get_rect(center=position)
-        self.velocity = direction * random.uniform(8, 12) #random.uniform - random floating number between (two included)
-        self.offset = Vector2(0, 0) #camera offset
+LIFETIME = 30 #frames
+LENGTHS = (100, 120, 140, 160, 180, 200) #pre-baked line lengths, random lengths snap to the nearest
+THICKNESSES = (1, 2, 3)
 
-    def update(self):
-        self.age += 1
-        self.rect.center += self.velocity
-        self.image.set_alpha(255 - int(255 * (self.age / self.lifetime)))
-        
-        #remove when expired
-        if self.age >= self.lifetime:
-            self.kill()
\ No newline at end of file
+#speedlines shown on gravity flips, as particles in a shared ParticlePool
+class SpeedlineEmitter:
+    def __init__(self, pool):
+        self.pool = pool
+        self.textures = {} #(thickness, length) -> texture index in the pool
+        for thickness in THICKNESSES:
+            for length in LENGTHS:
+                image = pygame.Surface((thickness, length), pygame.SRCALPHA)
+                image.fill(COLORS["WHITE"])
+                self.textures[(thickness, length)] = pool.add_texture(image)
+
+    def emit(self, position, direction, rng) -> None:
+        #random properties, drawn from rng in the same order as before so seeded runs look the same
+        length = rng.randint(100,200) #from 100 to 200, vertical length
+        thickness = rng.randint(1, 3) #1,2,3
+        alpha = rng.randint(150, 255) #a little transparent
+        velocity = direction * rng.uniform(8, 12) #uniform - random floating number between (two included)
+        length = min(LENGTHS, key=lambda baked: abs(baked - length))
+        self.pool.emit(position, velocity, LIFETIME, self.textures[(thickness, length)], alpha)
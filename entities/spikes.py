@@ -1,16 +1,26 @@
 import pygame
 from entities.game_object import GameObject
+from asset_registry import ASSETS
 import os
 
 class Spike(GameObject):
-    def __init__(self, x: int, y: int, platforms_group: pygame.sprite.Group):
+    def __init__(self, x: int, y: int, covered: bool = False):
         super().__init__(x, y)
 
-        normal_sprite = pygame.image.load(os.path.join("assets", "images", "spike.png")).convert_alpha()
-        alt_sprite = pygame.image.load(os.path.join("assets", "images", "spike2.png")).convert_alpha()
+        #covered: a platform tile sits right above, so the spike hangs from it (LevelLoader works this out)
+        self.covered = covered
+        self.image = Spike._image(covered)
+        self.rect = self.image.get_rect(topleft=(x, y))
 
-        rect_above = pygame.Rect(x, y - 30, 30, 30)
-        is_covered = any(platform.rect.colliderect(rect_above) for platform in platforms_group)
+    @staticmethod
+    def _image(covered: bool) -> pygame.Surface:
+        sprite_name = "spike2.png" if covered else "spike.png"
+        return ASSETS.image(os.path.join("assets", "images", sprite_name))
 
-        self.image = alt_sprite if is_covered else normal_sprite
-        self.rect = self.image.get_rect(topleft=(x, y))
+    def set_covered(self, covered: bool) -> bool:
+        #returns whether the image changed
+        if covered == self.covered:
+            return False
+        self.covered = covered
+        self.image = Spike._image(covered)
+        return True
@@ -0,0 +1,47 @@
+import pygame
+import pygame.freetype
+from collections import OrderedDict
+from constants import FONT_PATH
+from language_manager import LANG
+
+#opens each (path, size) font once and hands the same handle to every state and widget.
+#sizes that depend on zoom keep appearing, so the least recently used handles get dropped.
+#rendered text is cached the same way, so unchanged HUD and menu text is just a blit
+class FontManager:
+    def __init__(self, max_fonts: int = 24, max_texts: int = 256):
+        self.max_fonts = max_fonts
+        self.max_texts = max_texts
+        self._fonts = OrderedDict()
+        self._texts = OrderedDict()
+        LANG.add_listener(self.clear_text_cache) #every visible string changes with the language
+
+    def get(self, size: int, path: str = FONT_PATH) -> pygame.freetype.Font:
+        key = (path, size)
+        font = self._fonts.get(key)
+        if font is not None:
+            self._fonts.move_to_end(key)
+            return font
+        font = pygame.freetype.Font(path, size)
+        self._fonts[key] = font
+        if len(self._fonts) > self.max_fonts:
+            self._fonts.popitem(last=False)
+        return font
+
+    def render(self, text: str, size: int, color: tuple, path: str = FONT_PATH):
+        #same (surface, rect) pair as Font.render; the surface is shared, so don't draw on it or change its alpha
+        key = (text, size, tuple(color), path, LANG.current_lang)
+        cached = self._texts.get(key)
+        if cached is not None:
+            self._texts.move_to_end(key)
+        else:
+            cached = self.get(size, path).render(text, color)
+            self._texts[key] = cached
+            if len(self._texts) > self.max_texts:
+                self._texts.popitem(last=False)
+        surface, rect = cached
+        return surface, rect.copy() #callers move the rect around
+
+    def clear_text_cache(self) -> None:
+        self._texts.clear()
+
+FONTS = FontManager()
@@ -1,15 +1,44 @@
 import pygame
 import sys
-from constants import CONFIG
+import argparse
+import random
+from constants import CONFIG, TICK_RATE, MAX_FRAME_TIME
 from game_states.state_manager import StateManager
 from game_states.story import GameStateStory
 from game_states.menu import GameStateMenu
 from language_manager import LANG
+from profiler import PROFILER
+from presenter import PRESENTER
+from save_system import SAVES
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Gravity Platformer")
+    parser.add_argument("--level", type=int, help="start straight in this level instead of the menu")
+    parser.add_argument("--record", metavar="PATH", help="record the level's input to PATH (implies --level, default 1)")
+    parser.add_argument("--replay", metavar="PATH", help="play back an input recording")
+    parser.add_argument("--seed", type=int, help="random seed for effects when starting a level directly")
+    parser.add_argument("--dev", action="store_true", help="reload levels/levelN.txt into the running level when it changes")
+    return parser.parse_args(argv)
+
+def create_first_state(state_manager: StateManager, args):
+    from game_states.play import GameStatePlay
+    from replay import InputRecorder, InputReplay
+    if args.replay:
+        replay = InputReplay(args.replay)
+        return GameStatePlay(state_manager, replay.level_num, seed=replay.seed, replay=replay)
+    if args.record or args.level:
+        level_num = args.level or 1
+        seed = args.seed if args.seed is not None else random.randrange(2**32)
+        recorder = InputRecorder(args.record, level_num, seed) if args.record else None
+        return GameStatePlay(state_manager, level_num, seed=seed, recorder=recorder)
+    return GameStateMenu(state_manager)
+
+def main(argv=None):
+    args = parse_args(argv)
     pygame.init()
 
     CONFIG.load_config()
+    CONFIG.dev_mode = args.dev
 
     flags = pygame.FULLSCREEN if CONFIG.fullscreen else 0
     screen = pygame.display.set_mode((CONFIG.WIDTH, CONFIG.HEIGHT), flags)
@@ -21,36 +50,70 @@ def main():
     LANG.load_languages()
     #set initial language from config
     LANG.set_language(CONFIG.LANGUAGE)
+    LANG.add_listener(PRESENTER.invalidate) #any text on screen may be in the old language
     
     #resize handler
     def handle_resize():
         nonlocal screen
         flags = pygame.FULLSCREEN if CONFIG.fullscreen else 0
         screen = pygame.display.set_mode((CONFIG.WIDTH, CONFIG.HEIGHT), flags)
+        PRESENTER.invalidate()
         #refresh all states
         for state in state_manager._states:
             state.draw(screen) #forcing redraw with new resolution
 
     state_manager.set_resize_callback(handle_resize)
     
-    #initial state - start with main menu
-    state_manager.push_state(GameStateMenu(state_manager))
+    #initial state - main menu, unless a level/recording was asked for on the command line
+    state_manager.push_state(create_first_state(state_manager, args))
     
+    #fixed timestep: the simulation always advances in 1/TICK_RATE steps, however fast frames are drawn
+    tick_length = 1 / TICK_RATE
+    accumulator = 0.0
+    clock.tick()
     while True:
-        events = pygame.event.get()
-        for event in events:
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-        current_state = state_manager.current_state
-        if current_state:
-            current_state.handle_events(events)
-            current_state.update()
-            current_state.draw(screen)
+        accumulator += min(clock.tick(CONFIG.fps) / 1000, MAX_FRAME_TIME)
+        PROFILER.begin_frame()
+        with PROFILER.phase("events"):
+            events = pygame.event.get()
+            for event in events:
+                if event.type == pygame.QUIT:
+                    SAVES.wait() #let a save in progress reach the disk
+                    pygame.quit()
+                    sys.exit()
+                #profiler: F3 shows/hides the overlay, F4 writes the buffered frames to a file
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    PROFILER.toggle()
+                    PRESENTER.invalidate() #repaint the screen under the overlay
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and PROFILER.enabled:
+                    PROFILER.dump()
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    PRESENTER.invalidate()
+
+            current_state = state_manager.current_state
+            if current_state:
+                current_state.handle_events(events)
+
+        with PROFILER.phase("update"):
+            while accumulator >= tick_length:
+                current_state = state_manager.current_state #updates can switch states
+                if not current_state:
+                    break
+                current_state.update()
+                accumulator -= tick_length
+
+        with PROFILER.phase("draw"):
+            if PROFILER.enabled:
+                PRESENTER.invalidate() #the graph changes every frame and is blended over the screen
+            current_state = state_manager.current_state
+            if current_state:
+                current_state.set_interpolation(min(1.0, accumulator / tick_length))
+                current_state.draw(screen)
+            PROFILER.draw(screen)
         
-        pygame.display.flip()
-        clock.tick(CONFIG.fps)
+        with PROFILER.phase("present"):
+            PRESENTER.present()
+        PROFILER.end_frame()
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import List
 import pygame
+from presenter import PRESENTER
 
 #abstract base class defining the interface for all game states (menu, play, pause)
 class GameState(ABC):
+    _drawn_generation = None
+
     @abstractmethod
     def handle_events(self, events: List[pygame.event.Event]) -> None:
         pass
@@ -15,3 +18,24 @@ class GameState(ABC):
     @abstractmethod
     def draw(self, screen: pygame.Surface) -> None:
         pass
+
+    def set_interpolation(self, alpha: float) -> None:
+        #how far (0..1) the next draw is between the last two updates; only states that move things need it
+        pass
+
+    def needs_full_redraw(self) -> bool:
+        #true on the first draw after the presenter was invalidated (state switch, resize) or redraw_all()
+        if self._drawn_generation == PRESENTER.generation:
+            return False
+        self._drawn_generation = PRESENTER.generation
+        return True
+
+    def redraw_all(self) -> None:
+        self._drawn_generation = None
+
+    def draw_dirty_buttons(self, screen: pygame.Surface, buttons) -> None:
+        #only buttons whose hover/text changed since they were last drawn
+        for button in buttons:
+            if button.dirty:
+                button.draw(screen)
+                PRESENTER.mark(button.rect)
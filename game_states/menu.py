@@ -1,12 +1,14 @@
 import pygame
 import sys
-import json
 import os
 from typing import List
 from ui.button import Button
 from constants import COLORS, CONFIG
+from font_manager import FONTS
 from game_states.base import GameState
+from presenter import PRESENTER
 from language_manager import LANG
+from save_system import SAVES
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -28,16 +30,18 @@ class GameStateMenu(GameState):
         self.last_width = CONFIG.WIDTH
         self.last_height = CONFIG.HEIGHT
         self.last_lang = LANG.current_lang
+        self.redraw_all()
         
         #create buttons with translation keys
         self.button_keys = [
             ("start_game", self.start_game),
             ("load_game", self.load_game),
+            (None, self.next_slot), #save slot, labelled by SAVES
             ("settings", self.open_settings),
             ("quit", self.quit_game)
         ]
 
-        y_positions = [200, 280, 360, 440]
+        y_positions = [180, 260, 340, 420, 500]
         self.buttons = []
         
         for i, (key, action) in enumerate(self.button_keys):
@@ -45,9 +49,10 @@ class GameStateMenu(GameState):
                 CONFIG.WIDTH//2-150, 
                 y_positions[i], 
                 300, 60, 
-                LANG.strings["ui"][key], 
+                LANG.strings["ui"][key] if key else SAVES.slot_label(), 
                 action
             ))
+        self.slot_button = self.buttons[2]
 
     def update(self) -> None:
         #recreate buttons if resolution or language changed
@@ -60,18 +65,23 @@ class GameStateMenu(GameState):
         from game_states.play import GameStatePlay
         self.state_manager.push_state(GameStatePlay(self.state_manager))
     
+    def next_slot(self) -> None:
+        SAVES.next_slot()
+        self.slot_button.set_text(SAVES.slot_label())
+
     def open_settings(self):
         from game_states.settings import GameStateSettings
         self.state_manager.push_state(GameStateSettings(self.state_manager))
 
     def quit_game(self) -> None:
+        SAVES.wait()
         pygame.quit()
         sys.exit()
     
     def load_game(self) -> None:
         try:
-            with open("saves/save.json", "r") as f:
-                save_data = json.load(f)
+            SAVES.wait() #a save still being written is the one to load
+            save_data = SAVES.load(SAVES.slot)
             
             #clear existing states
             while self.state_manager._states:
@@ -80,9 +90,7 @@ class GameStateMenu(GameState):
             #create new play state with saved data
             from game_states.play import GameStatePlay
             play_state = GameStatePlay(self.state_manager, save_data["level"])
-            play_state.level.player.set_position(save_data["player_x"], save_data["player_y"])
-            play_state.level.player.set_reset_position(save_data["reset_x"], save_data["reset_y"])
-            play_state.level.player.gravity_direction = save_data.get("gravity", 1)
+            SAVES.restore(play_state, save_data)
             self.state_manager.push_state(play_state)
             
         except Exception as e:
@@ -101,13 +109,14 @@ class GameStateMenu(GameState):
                     button.action()
                     
     def draw(self, screen: pygame.Surface) -> None:
+        if not self.needs_full_redraw():
+            self.draw_dirty_buttons(screen, self.buttons)
+            return
         screen.fill(COLORS["MENU_BG"])
-        font_large = pygame.freetype.Font('fonts/Silver.ttf',90)
-        title_surf, title_rect = font_large.render("Gravity Platformer", COLORS["WHITE"])
+        title_surf, title_rect = FONTS.render("Gravity Platformer", 90, COLORS["WHITE"])
         title_rect.center = (CONFIG.WIDTH//2, 100)
         screen.blit(title_surf, title_rect)
         
         for button in self.buttons:
             button.draw(screen)
-        
-        pygame.display.flip()
\ No newline at end of file
+        PRESENTER.mark_full()
\ No newline at end of file
@@ -1,12 +1,13 @@
 import pygame
-import json
-import os
 from typing import List
 from game_states.base import GameState
+from presenter import PRESENTER
 from game_states.menu import GameStateMenu
 from ui.button import Button
-from constants import COLORS, CONFIG
+from constants import COLORS, CONFIG, TICK_RATE
+from font_manager import FONTS
 from language_manager import LANG
+from save_system import SAVES
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -16,12 +17,19 @@ class GameStatePaused(GameState):
     def __init__(self, state_manager: 'StateManager'):
         self.state_manager = state_manager
         self.save_message_timer = 0
+        SAVES.poll() #results of saves from an earlier pause are not this menu's news
+        self.slot_button = Button(CONFIG.WIDTH//2-150, CONFIG.HEIGHT//2+100, 300, 60, SAVES.slot_label(), self.next_slot)
         self.buttons = [
             Button(CONFIG.WIDTH//2-150, CONFIG.HEIGHT//2-60, 300, 60,LANG.strings["ui"]["continue"], self.continue_game),
             Button(CONFIG.WIDTH//2-150, CONFIG.HEIGHT//2+20, 300, 60,LANG.strings["ui"]["save_game"], self.save_game),
-            Button(CONFIG.WIDTH//2-150, CONFIG.HEIGHT//2+100, 300, 60,LANG.strings["ui"]["main_menu"], self.main_menu)
+            self.slot_button,
+            Button(CONFIG.WIDTH//2-150, CONFIG.HEIGHT//2+180, 300, 60,LANG.strings["ui"]["main_menu"], self.main_menu)
         ]
 
+    def next_slot(self) -> None:
+        SAVES.next_slot()
+        self.slot_button.set_text(SAVES.slot_label())
+
     def continue_game(self) -> None:
         self.state_manager.pop_state()
 
@@ -38,8 +46,18 @@ class GameStatePaused(GameState):
                     button.action()
 
     def update(self) -> None:
+        for slot, error in SAVES.poll():
+            if error is None:
+                self.save_message_timer = 2.5
+                self.slot_button.set_text(SAVES.slot_label())
+                self.redraw_all()
+                print(f"Game saved to slot {slot}")
+            else:
+                print(f"Save failed: {error}")
         if self.save_message_timer > 0:
-            self.save_message_timer -= 1/CONFIG.fps #decrease by frame rate
+            self.save_message_timer -= 1/TICK_RATE #decrease by update rate
+            if self.save_message_timer <= 0:
+                self.redraw_all() #the message sits on the dimmed game, so it goes away with a full redraw
     
     def save_game(self) -> None:
         from game_states.play import GameStatePlay
@@ -51,30 +69,22 @@ class GameStatePaused(GameState):
                 break
         
         if current_play_state:
-            save_data = {
-                "level": current_play_state.level_num,
-                "player_x": current_play_state.level.player.rect.x,
-                "player_y": current_play_state.level.player.rect.y,
-                "reset_x": current_play_state.level.player.reset_x,
-                "reset_y": current_play_state.level.player.reset_y,
-                "gravity": current_play_state.level.player.gravity_direction
-            }
-            
-            try:
-                with open("saves/save.json", "w") as f:
-                    json.dump(save_data, f)
-                self.save_message_timer = 2.5
-                print("Game saved successfully!")
-            except Exception as e:
-                print(f"Save failed: {str(e)}")
+            #only the snapshot happens here, writing the file is left to the save worker
+            SAVES.save(SAVES.slot, SAVES.snapshot(current_play_state))
 
     def draw(self, screen: pygame.Surface) -> None:
+        if not self.needs_full_redraw():
+            self.draw_dirty_buttons(screen, self.buttons)
+            return
+        #the game under the pause menu is drawn once, dimmed, instead of the overlay piling up every frame
+        states = self.state_manager._states
+        if self in states and states.index(self) > 0:
+            states[states.index(self) - 1].draw(screen)
         overlay = pygame.Surface((CONFIG.WIDTH, CONFIG.HEIGHT), pygame.SRCALPHA)
         overlay.fill(COLORS["PAUSE_OVERLAY"])
         screen.blit(overlay, (0, 0))
         
-        font_large = font = pygame.freetype.Font('fonts/Silver.ttf',70)
-        title_surf, title_rect = font_large.render(LANG.strings["ui"]["paused"], COLORS["WHITE"])
+        title_surf, title_rect = FONTS.render(LANG.strings["ui"]["paused"], 70, COLORS["WHITE"])
         title_rect.center = (CONFIG.WIDTH//2, CONFIG.HEIGHT//2 - 100)
         screen.blit(title_surf, title_rect)
         
@@ -82,10 +92,7 @@ class GameStatePaused(GameState):
             button.draw(screen)
         
         if self.save_message_timer > 0:
-            font = pygame.freetype.Font('fonts/Silver.ttf',34)
-            text_surf, text_rect = font.render(LANG.strings["ui"]["game_saved"], COLORS["GREEN"])
+            text_surf, text_rect = FONTS.render(LANG.strings["ui"]["game_saved"], 34, COLORS["GREEN"])
             text_rect.bottomright = (CONFIG.WIDTH - 20, CONFIG.HEIGHT - 20)
             screen.blit(text_surf, text_rect)
-
-        
-        pygame.display.flip()
+        PRESENTER.mark_full()
@@ -1,14 +1,23 @@
 import pygame
 from pygame.math import Vector2
 import random
-from entities.speedlines import Speedline
+from entities.particles import ParticlePool
+from entities.speedlines import SpeedlineEmitter
 from typing import List
 from game_states.base import GameState
 from game_states.paused import GameStatePaused
-from level import Level, LevelLoader
-from collision_system import CollisionSystem
-from constants import COLORS, PLAYER_SPEED, SPRINT_ACCELERATION, SPRINT_SPEED, CONFIG, BG_IMAGE_PATH
+from simulation import Simulation, InputFrame
+from level import LevelLoader
+from level_watcher import LevelWatcher
+from replay import encode_input, decode_input, state_checksum
+from chunk_renderer import ChunkRenderer
+from scaled_cache import ScaledCache
+from constants import COLORS, CONFIG, BG_IMAGE_PATH, NUM_LEVELS
+from font_manager import FONTS
 from language_manager import LANG
+from asset_registry import ASSETS
+from profiler import PROFILER
+from presenter import PRESENTER
 
 from typing import TYPE_CHECKING
 
@@ -16,72 +25,154 @@ if TYPE_CHECKING:
     from game_states.state_manager import StateManager
 
 class GameStatePlay(GameState):
-    def __init__(self, state_manager: 'StateManager', level_num: int = 1):
+    def __init__(self, state_manager: 'StateManager', level_num: int = 1, seed: int = None,
+                 recorder=None, replay=None, prepared=None):
         self.state_manager = state_manager
         self.level_num = level_num
-        self.level = LevelLoader.load(level_num)
+        #prepared: LevelData read ahead of time by a LevelPreloader, only the sprites are left to build
+        self.simulation = Simulation(level_num, LevelLoader.build(prepared) if prepared else None)
+        self.level = self.simulation.level
+        self.pending_input = InputFrame() #presses collected by handle_events, used up by the next update
+        self.pending_zoom_in = False
+        self.pending_zoom_out = False
+
+        #input recording/replay (see replay.py); the seed makes speedlines repeat too
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.recorder = recorder
+        self.replay = replay
+        self.static_layer = ChunkRenderer(self.level.static_sprites) #baked once per level
+        self.watcher = LevelWatcher(level_num) if CONFIG.dev_mode and not replay else None
+        self.scaled = ScaledCache() #per-zoom copies of chunks and sprites for direct drawing
         self.camera = (0, 0)
-        self.background = pygame.image.load(BG_IMAGE_PATH).convert()
-        self.original_bg = self.background.copy()
+        self.background = ASSETS.image(BG_IMAGE_PATH, alpha=False)
+        self.original_bg = self.background
 
-        self.speed_lines = pygame.sprite.Group()
+        self.particles = ParticlePool()
+        self.speedlines = SpeedlineEmitter(self.particles)
         self.zoom = self.state_manager.zoom_level  # <-- use saved zoom
         self.min_zoom = 0.5
         self.max_zoom = 2.0
 
         self.cached_zoom = None
         self.cached_scaled_bg = None
+        self.cached_screen_bg = None
+
+        #positions before the last update, drawn frames blend from them towards the current ones
+        self.interpolation = 1.0
+        self.previous_positions = {}
 
     def handle_events(self, events: List[pygame.event.Event]) -> None:
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                self.level.player.flip_gravity()
+                self.pending_input.flip = True
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_l:
-                    self.level.player.flip_gravity()
+                    self.pending_input.flip = True
                 if event.key == pygame.K_SPACE:
-                    self.level.player.jump()
+                    self.pending_input.jump = True
                 if event.key == pygame.K_r:
-                    self.level.player.reset_position()
+                    self.pending_input.reset = True
                 if event.key == pygame.K_ESCAPE:
                     self.state_manager.push_state(GameStatePaused(self.state_manager))
                 # Zoom controls
                 if event.key == pygame.K_z:
-                    self.zoom = max(self.min_zoom, self.zoom - 0.1)
-                    self.state_manager.zoom_level = self.zoom
+                    self.pending_zoom_out = True
 
                 if event.key == pygame.K_c:
-                    self.zoom = min(self.max_zoom, self.zoom + 0.1)
-                    self.state_manager.zoom_level = self.zoom
+                    self.pending_zoom_in = True
 
-    def update(self) -> None:
-        keys = pygame.key.get_pressed()
-        self.level.player.is_sprinting = keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]
+    def set_interpolation(self, alpha: float) -> None:
+        self.interpolation = alpha
+
+    def _render_position(self, sprite) -> tuple:
+        previous = self.previous_positions.get(sprite)
+        if previous is None:
+            return sprite.rect.topleft
+        dx = sprite.rect.x - previous[0]
+        dy = sprite.rect.y - previous[1]
+        if abs(dx) > 64 or abs(dy) > 64: #teleported (reset, checkpoint), don't smear it across the screen
+            return sprite.rect.topleft
+        return (previous[0] + dx * self.interpolation, previous[1] + dy * self.interpolation)
 
-        if self.level.player.is_sprinting:
-            self.level.player.current_speed = min(SPRINT_SPEED, self.level.player.current_speed + SPRINT_ACCELERATION)
+    def update(self) -> None:
+        self.previous_positions = {sprite: sprite.rect.topleft for sprite in (self.level.player, *self.level.bosses)}
+        if self.replay and self.replay.finished:
+            self._finish_replay()
+            return
+        if self.replay:
+            frame, zoom_in, zoom_out = decode_input(self.replay.next_bits())
         else:
-            self.level.player.current_speed = max(PLAYER_SPEED, self.level.player.current_speed - SPRINT_ACCELERATION*1.2)
+            keys = pygame.key.get_pressed()
+            frame = self.pending_input
+            frame.left = keys[pygame.K_a]
+            frame.right = keys[pygame.K_d]
+            frame.sprint = keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]
+            zoom_in, zoom_out = self.pending_zoom_in, self.pending_zoom_out
+        self.pending_input = InputFrame()
+        self.pending_zoom_in = self.pending_zoom_out = False
 
-        x_velocity = 0
-        if keys[pygame.K_a]:
-            x_velocity -= self.level.player.current_speed
-        if keys[pygame.K_d]:
-            x_velocity += self.level.player.current_speed
+        if zoom_out:
+            self.zoom = max(self.min_zoom, self.zoom - 0.1)
+            self.state_manager.zoom_level = self.zoom
+        if zoom_in:
+            self.zoom = min(self.max_zoom, self.zoom + 0.1)
+            self.state_manager.zoom_level = self.zoom
 
-        self.level.player.update(x_velocity)
+        if self.watcher:
+            self._hot_reload()
 
-        self._handle_horizontal_collision()
-        self.level.player.apply_physics(self.level.platforms)
-        CollisionSystem.handle_collisions(self.level.player, self.level, self.state_manager)
-        self.level.orbs.update()
-        if self.level.player.just_flipped:
-            self._create_speedlines()
-            self.level.player.reset_flip_flag()
+        with PROFILER.phase("update.simulation"):
+            events = self.simulation.step(frame)
+        if self.recorder or self.replay:
+            checksum = state_checksum(self.level)
+            if self.recorder:
+                self.recorder.record(encode_input(frame, zoom_in, zoom_out), checksum)
+            if self.replay:
+                self.replay.check(checksum)
 
-        self.speed_lines.update()
-        for boss in self.level.bosses:
-            boss.update(self.level.player.rect)
+        for event in events:
+            self._handle_game_event(event)
+        with PROFILER.phase("update.particles"):
+            self.particles.update()
+
+    def _hot_reload(self) -> None:
+        #dev mode: patch in whatever changed in the level file, the player stays where it is
+        changes = self.watcher.poll()
+        if changes is None:
+            return
+        added, removed = changes
+        dirty, skipped = LevelLoader.patch(self.level, added, removed)
+        self.static_layer.refresh(self.level.static_sprites, dirty)
+        print(f"Reloaded level {self.level_num}: {len(added) - len(skipped)} added, {len(removed)} removed")
+        for (obj_type, x, y, extra), error in skipped:
+            #left out until the line is fixed, the next save picks it up as a new entry
+            print(f"Skipped {obj_type} at {x},{y}: {error}")
+
+    def _finish_replay(self) -> None:
+        from game_states.menu import GameStateMenu
+        if self.replay.divergence is None:
+            print(f"Replay finished: {self.replay.position} ticks, no divergence")
+        else:
+            print(f"Replay finished: {self.replay.position} ticks, diverged at tick {self.replay.divergence}")
+        self.state_manager.pop_state()
+        self.state_manager.push_state(GameStateMenu(self.state_manager))
+
+    def _handle_game_event(self, event) -> None:
+        from game_states.story import GameStateStory
+        if event.kind in ("teleport", "boss") and self.recorder:
+            self.recorder.close() #the recording covers this level only
+        if event.kind == "teleport":
+            if event.data > NUM_LEVELS:
+                #trigger ending story
+                self.state_manager.push_state(GameStateStory(self.state_manager, 99))
+            else:
+                self.state_manager.pop_state()
+                self.state_manager.push_state(GameStateStory(self.state_manager, event.data))
+        elif event.kind == "boss":
+            self.state_manager.push_state(GameStateStory(self.state_manager, 98))
+        elif event.kind == "flip":
+            self._create_speedlines()
         
     def _create_speedlines(self) -> None:
         direction = Vector2(0, self.level.player.gravity_direction)
@@ -90,81 +181,133 @@ class GameStatePlay(GameState):
         player_y = self.level.player.rect.centery
 
         #create lines across the entire visible width
-        for _ in range(random.randint(30, 40)):
-            x = random.randint(camera_left, camera_right)
-            y = player_y + random.randint(-200, 200) #vertical spread
+        for _ in range(self.rng.randint(30, 40)):
+            x = self.rng.randint(camera_left, camera_right)
+            y = player_y + self.rng.randint(-200, 200) #vertical spread
             #random horizontal offset
             offset = Vector2(
-                random.randint(-50, 50),
-                random.randint(-100, 100)
+                self.rng.randint(-50, 50),
+                self.rng.randint(-100, 100)
             )
             pos = Vector2(x, y) + offset
             
-            self.speed_lines.add(Speedline(pos, direction))
-
-    def _handle_horizontal_collision(self) -> None:
-        for platform in self.level.platforms:
-            if self.level.player.rect.colliderect(platform.rect):
-                if self.level.player.rect.centerx < platform.rect.centerx:
-                    self.level.player.rect.right = platform.rect.left
-                else:
-                    self.level.player.rect.left = platform.rect.right
+            self.speedlines.emit(pos, direction, self.rng)
 
     def draw(self, screen: pygame.Surface) -> None:
         #calculate camera position with zoom
         self.zoomed_width = CONFIG.WIDTH / self.zoom
         self.zoomed_height = CONFIG.HEIGHT / self.zoom
+        player_x, player_y = self._render_position(self.level.player)
         self.camera = (
-            self.level.player.rect.centerx - self.zoomed_width // 2,
-            self.level.player.rect.centery - self.zoomed_height // 2
+            player_x + self.level.player.rect.width // 2 - self.zoomed_width // 2,
+            player_y + self.level.player.rect.height // 2 - self.zoomed_height // 2
         )
         
-        #create a surface to render the zoomed view
-        zoom_surface = pygame.Surface((self.zoomed_width, self.zoomed_height))
+        if CONFIG.render_mode == "scaled":
+            self._draw_scaled_frame(screen)
+        else:
+            self._draw_direct(screen)
         
-        if self.zoom != self.cached_zoom or not self.cached_scaled_bg:
-            #only scale background when zoom changes
-            bg_width = max(1, int(self.original_bg.get_width() * self.zoom))
-            bg_height = max(1, int(self.original_bg.get_height() * self.zoom))
-            self.cached_scaled_bg = pygame.transform.scale(self.original_bg, (bg_width, bg_height))
-            self.cached_zoom = self.zoom
-
-        tile = self.cached_scaled_bg
-        tile_width = tile.get_width()
-        tile_height = tile.get_height()
-        parallax_offset = -self.camera[0] * 0.5
-
-        #drawing background logic
-        x_start = parallax_offset % tile_width - tile_width
-        y_start = 0
-        x = x_start
-        while x < self.zoomed_width:
-            y = y_start
-            while y < self.zoomed_height:
-                zoom_surface.blit(tile, (x, y))
-                y += tile_height
-            x += tile_width        
-            
-        #draw all sprites on the zoom surface
-        for sprite in self.level.all_sprites:
-            screen_x = sprite.rect.x - self.camera[0]
-            screen_y = sprite.rect.y - self.camera[1]
-            if -sprite.rect.width < screen_x < self.zoomed_width and -sprite.rect.height < screen_y < self.zoomed_height:
-                zoom_surface.blit(sprite.image, (screen_x, screen_y))
+        with PROFILER.phase("draw.hud"):
+            self._draw_ui(screen)
+        PRESENTER.mark_full() #the whole view moves with the camera
+
+    def _visible_entities(self) -> list:
+        #dynamic sprites near the camera; the margin covers interpolated positions trailing their rects
+        view = pygame.Rect(int(self.camera[0]), int(self.camera[1]), int(self.zoomed_width) + 1, int(self.zoomed_height) + 1)
+        return self.level.entities_in(view.inflate(128, 128))
+
+    def _draw_direct(self, screen: pygame.Surface) -> None:
+        #everything is blitted straight onto the screen at zoom, from copies scaled once per zoom step
+        zoom = ScaledCache.zoom_step(self.zoom) / 10
+        self.scaled.set_zoom(zoom)
+        offset_x = round(self.camera[0] * zoom)
+        offset_y = round(self.camera[1] * zoom)
+
+        with PROFILER.phase("draw.background"):
+            if self.zoom != self.cached_zoom or not self.cached_screen_bg:
+                #the scaled-frame path scales the background into the zoomed view and then the
+                #view again, so on screen it ends up at zoom squared; keep that look
+                bg_width = max(1, int(self.original_bg.get_width() * self.zoom))
+                bg_height = max(1, int(self.original_bg.get_height() * self.zoom))
+                self.cached_screen_bg = pygame.transform.scale(
+                    self.original_bg, (max(1, round(bg_width * zoom)), max(1, round(bg_height * zoom))))
+                self.cached_scaled_bg = None
+                self.cached_zoom = self.zoom
+
+            tile = self.cached_screen_bg
+            tile_width = tile.get_width()
+            tile_height = tile.get_height()
+            parallax_offset = -self.camera[0] * 0.5 * zoom
+
+            x = parallax_offset % tile_width - tile_width
+            while x < CONFIG.WIDTH:
+                y = 0
+                while y < CONFIG.HEIGHT:
+                    screen.blit(tile, (x, y))
+                    y += tile_height
+                x += tile_width
+
+        with PROFILER.phase("draw.sprites"):
+            self.static_layer.draw_scaled(screen, self.camera, zoom, self.scaled)
+            for sprite in self._visible_entities():
+                sprite_x, sprite_y = self._render_position(sprite)
+                image = self.scaled.get(sprite.image, zoom)
+                screen_x = round(sprite_x * zoom) - offset_x
+                screen_y = round(sprite_y * zoom) - offset_y
+                if -image.get_width() < screen_x < CONFIG.WIDTH and -image.get_height() < screen_y < CONFIG.HEIGHT:
+                    screen.blit(image, (screen_x, screen_y))
+
+        with PROFILER.phase("draw.particles"):
+            self.particles.draw(screen, self.camera, zoom, self.scaled)
+
+    def _draw_scaled_frame(self, screen: pygame.Surface) -> None:
+        #the original path: draw the zoomed view at 1x, then scale the whole frame to the window
+        with PROFILER.phase("draw.background"):
+            #create a surface to render the zoomed view
+            zoom_surface = pygame.Surface((self.zoomed_width, self.zoomed_height))
         
-        #draw speedlines
-        for line in self.speed_lines:
-            line.offset.update(self.camera)
-            screen_x = line.rect.x - self.camera[0]
-            screen_y = line.rect.y - self.camera[1]
-            zoom_surface.blit(line.image, (screen_x, screen_y))
+            if self.zoom != self.cached_zoom or not self.cached_scaled_bg:
+                #only scale background when zoom changes
+                bg_width = max(1, int(self.original_bg.get_width() * self.zoom))
+                bg_height = max(1, int(self.original_bg.get_height() * self.zoom))
+                self.cached_scaled_bg = pygame.transform.scale(self.original_bg, (bg_width, bg_height))
+                self.cached_screen_bg = None
+                self.cached_zoom = self.zoom
+
+            tile = self.cached_scaled_bg
+            tile_width = tile.get_width()
+            tile_height = tile.get_height()
+            parallax_offset = -self.camera[0] * 0.5
+
+            #drawing background logic
+            x_start = parallax_offset % tile_width - tile_width
+            y_start = 0
+            x = x_start
+            while x < self.zoomed_width:
+                y = y_start
+                while y < self.zoomed_height:
+                    zoom_surface.blit(tile, (x, y))
+                    y += tile_height
+                x += tile_width        
+            
+        with PROFILER.phase("draw.sprites"):
+            #static tiles come from the baked chunks, only dynamic sprites are drawn one by one
+            self.static_layer.draw(zoom_surface, self.camera, self.zoomed_width, self.zoomed_height)
+            for sprite in self._visible_entities():
+                sprite_x, sprite_y = self._render_position(sprite)
+                screen_x = sprite_x - self.camera[0]
+                screen_y = sprite_y - self.camera[1]
+                if -sprite.rect.width < screen_x < self.zoomed_width and -sprite.rect.height < screen_y < self.zoomed_height:
+                    zoom_surface.blit(sprite.image, (screen_x, screen_y))
         
-        #scale the zoom surface to the screen size
-        scaled_zoom = pygame.transform.scale(zoom_surface, (CONFIG.WIDTH, CONFIG.HEIGHT))
-        screen.blit(scaled_zoom, (0, 0))
+        with PROFILER.phase("draw.particles"):
+            self.particles.draw(zoom_surface, self.camera)
         
-        self._draw_ui(screen)
-        pygame.display.flip()
+        with PROFILER.phase("draw.scale"):
+            #scale the zoom surface to the screen size
+            scaled_zoom = pygame.transform.scale(zoom_surface, (CONFIG.WIDTH, CONFIG.HEIGHT))
+            screen.blit(scaled_zoom, (0, 0))
 
     def _draw_ui(self, screen: pygame.Surface) -> None:
         player = self.level.player
@@ -182,28 +325,26 @@ class GameStatePlay(GameState):
             LANG.strings["hud"]["zoom"].format(f"{self.zoom:.1f}")
         ]
 
-        font_small = pygame.freetype.Font('fonts/Silver.ttf',30)
         line_height = 30
         start_x = 10
         start_y = 40
 
         gravity_text = LANG.strings["hud"]["down"] if player.gravity_direction == 1 else LANG.strings["hud"]["up"]
-        text_surf, _ = font_small.render(gravity_text, COLORS["WHITE"])
+        text_surf, _ = FONTS.render(gravity_text, 30, COLORS["WHITE"])
         screen.blit(text_surf, (10, 10))
 
         for i, text in enumerate(instructions):
-            text_surf, _ = font_small.render(text, COLORS["WHITE"])
+            text_surf, _ = FONTS.render(text, 30, COLORS["WHITE"])
             screen.blit(text_surf, (start_x, start_y + i * line_height))
             
         if self.level.active_sign:
             sign = self.level.active_sign
             scaled_font_size = max(36, int(32 * self.zoom))
-            font = pygame.freetype.Font('fonts/Silver.ttf', scaled_font_size)
             
             sign_screen_x = (sign.rect.x - self.camera[0]) * self.zoom
             sign_screen_y = (sign.rect.y - self.camera[1] - 40) * self.zoom
             
-            text_surf, text_rect = font.render(sign.message, COLORS["WHITE"])
+            text_surf, text_rect = FONTS.render(sign.message, scaled_font_size, COLORS["WHITE"])
             bg_rect = text_rect.inflate(int(20 * self.zoom), int(10 * self.zoom))
             bg_rect.center = (sign_screen_x, sign_screen_y)
             
@@ -1,8 +1,10 @@
 import pygame
 from typing import List
 from game_states.base import GameState
+from presenter import PRESENTER
 from ui.button import Button
 from constants import CONFIG, COLORS
+from font_manager import FONTS
 from language_manager import LANG
 
 class GameStateSettings(GameState):
@@ -23,25 +25,26 @@ class GameStateSettings(GameState):
         pass  #no updates needed
 
     def draw(self, screen: pygame.Surface) -> None:
+        if not self.needs_full_redraw():
+            self.draw_dirty_buttons(screen, self.buttons)
+            return
         screen.fill(COLORS["MENU_BG"])
-        font = pygame.freetype.Font('fonts/Silver.ttf',80)
         
         #draw section headers
-        font_section = pygame.freetype.Font('fonts/Silver.ttf',50)
-        res_text, res_rect = font_section.render(LANG.strings["ui"]["resolution"], COLORS["WHITE"])
+        res_text, res_rect = FONTS.render(LANG.strings["ui"]["resolution"], 50, COLORS["WHITE"])
         res_rect.midleft = (CONFIG.WIDTH//2 - 150, self.resolution_label_y)
         screen.blit(res_text, res_rect)
         
-        lang_text, lang_rect = font_section.render(LANG.strings["ui"]["language"], COLORS["WHITE"])
+        lang_text, lang_rect = FONTS.render(LANG.strings["ui"]["language"], 50, COLORS["WHITE"])
         lang_rect.midleft = (CONFIG.WIDTH//2 - 150, self.language_label_y)
         screen.blit(lang_text, lang_rect)
         
         for button in self.buttons:
             button.draw(screen)
-        
-        pygame.display.flip()
+        PRESENTER.mark_full()
 
     def _create_buttons(self):
+        self.redraw_all()
         button_height = 45
         button_spacing = 15
         section_spacing = 30
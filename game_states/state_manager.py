@@ -1,5 +1,6 @@
 from typing import List
 from game_states.base import GameState
+from presenter import PRESENTER
 
 class StateManager:
     def __init__(self):
@@ -9,10 +10,12 @@ class StateManager:
     
     def push_state(self, state: GameState) -> None:
         self._states.append(state)
+        PRESENTER.invalidate()
     
     def pop_state(self) -> None:
         if self._states:
             self._states.pop()
+            PRESENTER.invalidate()
     
     @property
     def current_state(self) -> GameState:
@@ -1,9 +1,12 @@
 import pygame
 from typing import List
 from game_states.base import GameState
+from presenter import PRESENTER
 from constants import CONFIG, COLORS
+from font_manager import FONTS
 from ui.button import Button
 from language_manager import LANG
+from level import LevelPreloader
 
 class GameStateStory(GameState):
     def __init__(self, state_manager, target_level: int):
@@ -12,6 +15,8 @@ class GameStateStory(GameState):
         self.target_level=target_level
         self.alpha = 0
         self.fade_speed = 5
+        self.drawn_page = None #what is on screen now, so a finished fade is not drawn again
+        self.drawn_alpha = None
         
         story_map = {
             2: "level2",
@@ -35,6 +40,8 @@ class GameStateStory(GameState):
                 if key in LANG.strings["story"]:
                     self.story_pages.append(LANG.strings["story"][key])
         self.active=bool(self.story_pages) #activate only if we have story pages
+        #read the next level while the pages are up; endings have no level to load
+        self.preloader = LevelPreloader(target_level) if target_level not in (98, 99) else None
         self.skip_button = Button(
             CONFIG.WIDTH - 120, 20, 100, 30, #right top corner
             LANG.strings["ui"]["skip"], self.skip_story,
@@ -50,8 +57,13 @@ class GameStateStory(GameState):
             from game_states.menu import GameStateMenu
             self.state_manager.push_state(GameStateMenu(self.state_manager))
         else:
-            from game_states.play import GameStatePlay
-            self.state_manager.push_state(GameStatePlay(self.state_manager, self.target_level))
+            self.state_manager.push_state(self._create_play_state())
+
+    def _create_play_state(self):
+        from game_states.play import GameStatePlay
+        #the preloaded level if it is ready, otherwise GameStatePlay loads it the slow way
+        prepared = self.preloader.result() if self.preloader else None
+        return GameStatePlay(self.state_manager, self.target_level, prepared=prepared)
 
     def handle_events(self, events: List[pygame.event.Event]) -> None:
         mouse_pos = pygame.mouse.get_pos()
@@ -75,8 +87,7 @@ class GameStateStory(GameState):
                                 from game_states.menu import GameStateMenu
                                 self.state_manager.push_state(GameStateMenu(self.state_manager))
                             else:  #level stories
-                                from game_states.play import GameStatePlay
-                                self.state_manager.push_state(GameStatePlay(self.state_manager, self.target_level))
+                                self.state_manager.push_state(self._create_play_state())
 
     def update(self) -> None:
         self.skip_button.rect.x = CONFIG.WIDTH - 120
@@ -87,31 +98,49 @@ class GameStateStory(GameState):
     def draw(self, screen: pygame.Surface) -> None:
         if not self.active or self.current_page >= len(self.story_pages):
             return
-        screen.fill(COLORS["BLACK"])
-        
+        full = self.needs_full_redraw() or self.current_page != self.drawn_page
+        if not full and self.alpha == self.drawn_alpha:
+            self.draw_dirty_buttons(screen, [self.skip_button])
+            return
+        self.drawn_page = self.current_page
+        self.drawn_alpha = self.alpha
+
         line_height = 40
         start_y = CONFIG.HEIGHT//2 - (len(self.story_pages[self.current_page]))*line_height//2
+        text_area = pygame.Rect(0, start_y - line_height, CONFIG.WIDTH,
+                                (len(self.story_pages[self.current_page]) + 1) * line_height)
+        if full:
+            screen.fill(COLORS["BLACK"])
+        else:
+            #mid-fade only the text block changes
+            screen.fill(COLORS["BLACK"], text_area)
+            PRESENTER.mark(text_area)
         
-        font = pygame.freetype.Font('fonts/Silver.ttf',44)
         for i, line in enumerate(self.story_pages[self.current_page]):
-            text_surf, _ = font.render(line, COLORS["WHITE"])
-            text_surf.set_alpha(self.alpha)
+            text_surf, _ = FONTS.render(line, 44, COLORS["WHITE"])
+            if self.alpha < 255:
+                #cached surfaces are shared, fade a copy instead
+                text_surf = text_surf.copy()
+                text_surf.set_alpha(self.alpha)
             text_rect = text_surf.get_rect(
                 center=(CONFIG.WIDTH//2, start_y + i*line_height)
             )
             screen.blit(text_surf, text_rect)
         
         if self.alpha == 255:
-            prompt_font = pygame.freetype.Font('fonts/Silver.ttf',40)
             prompt_text = LANG.strings["ui"]["press_z"] 
             if self.current_page == len(self.story_pages) - 1:
                 prompt_text = LANG.strings["ui"]["begin"]
             
-            prompt_surf, _ = prompt_font.render(prompt_text, COLORS["WHITE"])
+            prompt_surf, _ = FONTS.render(prompt_text, 40, COLORS["WHITE"])
             prompt_rect = prompt_surf.get_rect(
                 center=(CONFIG.WIDTH//2, CONFIG.HEIGHT - 50)
             )
             screen.blit(prompt_surf, prompt_rect)
+            PRESENTER.mark(prompt_rect)
         
         self.skip_button.draw(screen)
-        pygame.display.flip()
\ No newline at end of file
+        if full:
+            PRESENTER.mark_full()
+        else:
+            PRESENTER.mark(self.skip_button.rect)
\ No newline at end of file
@@ -4,8 +4,10 @@ import os
 class LanguageManager:
     def __init__(self):
         self.current_lang = "en"
-        self.strings = {}
+        self.strings = {} #the current pack, one of packs
         self.languages = self.get_available_languages()
+        self.packs = {} #language code -> parsed json, each file is read once
+        self._listeners = [] #called after every language switch
         
     def get_available_languages(self):
         languages = {}
@@ -17,20 +19,34 @@ class LanguageManager:
                     languages[lang_code] = lang_code
         return languages
         
+    def _pack(self, lang_code):
+        pack = self.packs.get(lang_code)
+        if pack is None:
+            with open(f"languages/{lang_code}.json", "r", encoding="utf-8") as f:
+                pack = json.load(f)
+            self.packs[lang_code] = pack
+        return pack
+
     def load_languages(self):
+        #parses every pack up front, switching language later is only a lookup
+        for lang_code in self.languages:
+            self._pack(lang_code)
         try:
-            with open(f"languages/{self.current_lang}.json", "r", encoding="utf-8") as f:
-                self.strings = json.load(f)
+            self.strings = self._pack(self.current_lang)
         except FileNotFoundError:
             print(f"Language file for {self.current_lang} not found! Using English.")
             self.current_lang = "en"
-            with open("languages/en.json", "r", encoding="utf-8") as f:
-                self.strings = json.load(f)
+            self.strings = self._pack("en")
     
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
     def set_language(self, lang_code):
         if lang_code in self.languages:
+            self.strings = self._pack(lang_code) #already parsed by load_languages, otherwise read now
             self.current_lang = lang_code
-            self.load_languages()
+            for callback in self._listeners:
+                callback()
             return True
         return False
 
@@ -1,6 +1,7 @@
 import pygame
+import threading
 from constants import CONFIG
-from entities.platforms import Platform
+from entities.platforms import Platform, UP, RIGHT, DOWN, LEFT
 from entities.spikes import Spike
 from entities.teleporters import Teleporter
 from entities.orbs import Orb
@@ -8,11 +9,15 @@ from entities.signs import Sign
 from entities.player import Player
 from entities.checkpoint import Checkpoint
 from entities.boss import Boss
-from language_manager import LANG
+from spatial_grid import SpatialGrid
+from trigger_system import TriggerSystem
+from level_format import read_level
 
 class Level:
     def __init__(self):
         self.all_sprites = pygame.sprite.Group() #initialise sprites
+        self.static_sprites = pygame.sprite.Group() #never move or change image, baked into chunks
+        self.dynamic_sprites = pygame.sprite.Group() #drawn individually, only the ones in view (entities_in)
         self.platforms = pygame.sprite.Group()
         self.spikes = pygame.sprite.Group()
         self.teleporters = pygame.sprite.Group()
@@ -22,71 +27,297 @@ class Level:
         self.checkpoints = pygame.sprite.Group()
         self.bosses = pygame.sprite.Group()
         self.active_checkpoint = None
+        self.active_sign = None
+        self.platform_grid = SpatialGrid(30) #merged platform colliders bucketed by tile cell
+        self.platform_colliders = []
+        self.triggers = TriggerSystem() #spikes, orbs, checkpoints, teleporters and sign radii
+        self.entity_grid = SpatialGrid(240) #dynamic sprites, for finding the ones in view
+        self.draw_order = {} #dynamic sprite -> position in dynamic_sprites, kept when drawing a subset
+        self.draw_count = 0
+        self.entry_sprites = {} #(type, x, y, extra) level file entry -> sprites made from it, for hot reload
+        self.level_num = None
+
+    def add_dynamic(self, sprite) -> None:
+        self.dynamic_sprites.add(sprite)
+        self.draw_order[sprite] = self.draw_count
+        self.draw_count += 1
+        self.entity_grid.insert(sprite)
+
+    def entities_in(self, rect: pygame.Rect) -> list:
+        #dynamic sprites in (or near, by cell) a world rect, in draw order. only the player and
+        #bosses move, they are re-bucketed here so the index is current whenever it is asked
+        for boss in self.bosses:
+            self.entity_grid.move(boss)
+        if self.player is not None:
+            self.entity_grid.move(self.player)
+        return sorted(self.entity_grid.query(rect), key=self.draw_order.__getitem__)
+
+class LevelData: #everything read from a level file, with world positions, before any sprite exists
+    def __init__(self, level_num: int):
+        self.level_num = level_num
+        self.platforms = [] #(x, y) of each platform tile
+        self.platform_neighbours = {} #(x, y) -> Platform neighbour bits
+        self.covered_spikes = set() #(x, y) of spikes with a platform tile right above
+        self.collider_rects = [] #merged platform rectangles
+        self.objects = [] #(type, x, y, extra) for everything else, in file order
+
+class Collider: #solid rectangle used only for collision, made of one or more platform tiles
+    def __init__(self, rect: pygame.Rect):
+        self.rect = rect
 
 class LevelLoader: #load levels from file
     @staticmethod
-    def load(level_num: int) -> Level:
-        level = Level()
-        platform_data = []
-        other_data = []
+    def merge_tiles(positions, tile_size: int = 30) -> list:
+        #greedy merge of tile top-left corners into as few rectangles as possible:
+        #horizontal runs per row first, then runs with the same span in consecutive rows are stacked
+        rows = {}
+        for x, y in set(positions):
+            rows.setdefault(y, []).append(x)
 
-        try:
-            with open(f'levels/level{level_num}.txt', 'r') as f:
-                for line in f:
-                    parts = line.strip().split(',')
-                    if not parts:
-                        continue
-                    if parts[0] == 'platform':
-                        platform_data.append(parts)
-                    else:
-                        other_data.append(parts)
-
-            # Najpierw platformy
-            for parts in platform_data:
-                x = int(parts[1]) * 30 + 400
-                y = -int(parts[2]) * 30 + 300
-                platform = Platform(x, y)
-                level.platforms.add(platform)
-                level.all_sprites.add(platform)
-
-            # Potem reszta
-            for parts in other_data:
-                obj_type = parts[0]
-                x = int(parts[1]) * 30 + 400
-                y = -int(parts[2]) * 30 + 300
-
-                if obj_type == 'spike':
-                    spike = Spike(x, y, level.platforms)
-                    level.spikes.add(spike)
-                    level.all_sprites.add(spike)
-                elif obj_type == 'teleport':
-                    tele = Teleporter(x, y, int(parts[3]))
-                    level.teleporters.add(tele)
-                    level.all_sprites.add(tele)
-                elif obj_type == 'orb':
-                    orb = Orb(x, y)
-                    level.orbs.add(orb)
-                    level.all_sprites.add(orb)
-                elif obj_type == 'sign':
-                    sign_key = parts[3]
-                    message = LANG.strings["signs"].get(sign_key, sign_key)
-                    sign = Sign(x, y, message)
-                    level.signs.add(sign)
-                    level.all_sprites.add(sign)
-                elif obj_type == 'checkpoint':
-                    checkpoint = Checkpoint(x, y)
-                    level.checkpoints.add(checkpoint)
-                    level.all_sprites.add(checkpoint)
-                elif obj_type == 'boss':
-                    boss_speed = float(parts[3]) if len(parts) > 3 else 3.0
-                    boss = Boss(x, y, boss_speed)
-                    level.bosses.add(boss)
-                    level.all_sprites.add(boss)
+        merged = []
+        open_rects = {} #(left, right) of a run -> rect still growing downwards
+        previous_y = None
+        for y in sorted(rows):
+            xs = sorted(rows[y])
+            runs = []
+            start = end = xs[0]
+            for x in xs[1:]:
+                if x == end + tile_size:
+                    end = x
+                else:
+                    runs.append((start, end))
+                    start = end = x
+            runs.append((start, end))
+
+            still_open = {}
+            for run in runs:
+                rect = open_rects.pop(run, None) if previous_y == y - tile_size else None
+                if rect is not None:
+                    rect.height += tile_size
+                else:
+                    rect = pygame.Rect(run[0], y, run[1] - run[0] + tile_size, tile_size)
+                    merged.append(rect)
+                still_open[run] = rect
+            open_rects = still_open
+            previous_y = y
+        return merged
+
+    @staticmethod
+    def analyse_neighbours(data: LevelData, tile_size: int = 30) -> None:
+        #one pass over the level with a tile occupancy set: which sides of each platform
+        #touch another platform (autotiling), and which spikes hang under a platform
+        occupied = set(data.platforms)
+        sides = ((UP, 0, -tile_size), (RIGHT, tile_size, 0), (DOWN, 0, tile_size), (LEFT, -tile_size, 0))
+        data.platform_neighbours = {}
+        for x, y in occupied:
+            data.platform_neighbours[(x, y)] = sum(bit for bit, dx, dy in sides if (x + dx, y + dy) in occupied)
+        data.covered_spikes = {(x, y) for obj_type, x, y, _ in data.objects
+                               if obj_type == 'spike' and (x, y - tile_size) in occupied}
 
+    @staticmethod
+    def build_platform_colliders(level: Level, rects: list = None) -> None:
+        #rendering keeps one sprite per tile, collision only sees the merged rectangles
+        if rects is None:
+            rects = LevelLoader.merge_tiles(platform.rect.topleft for platform in level.platforms)
+        level.platform_grid = SpatialGrid(30)
+        level.platform_colliders = [Collider(pygame.Rect(rect)) for rect in rects]
+        for collider in level.platform_colliders:
+            level.platform_grid.insert(collider)
+
+    @staticmethod
+    def prepare(level_num: int) -> LevelData:
+        #the file-reading and number-crunching half of loading; touches no surfaces or
+        #sprites, so it is safe to run on a worker thread (see LevelPreloader)
+        data = LevelData(level_num)
+        try:
+            #compiled levels/levelN.lvl when it is up to date, otherwise the text file
+            for obj_type, tile_x, tile_y, extra in read_level(f'levels/level{level_num}.txt'):
+                x, y = LevelLoader.world_position(tile_x, tile_y)
+                if obj_type == 'platform':
+                    data.platforms.append((x, y))
+                else:
+                    data.objects.append((obj_type, x, y, extra))
         except FileNotFoundError:
             print(f"Level {level_num} not found!")
-            return LevelLoader.load(1)
+            return LevelLoader.prepare(1)
+        data.collider_rects = LevelLoader.merge_tiles(data.platforms)
+        LevelLoader.analyse_neighbours(data)
+        return data
+
+    @staticmethod
+    def world_position(tile_x: int, tile_y: int) -> tuple:
+        return tile_x * 30 + 400, -tile_y * 30 + 300
+
+    @staticmethod
+    def add_platform(level: Level, x: int, y: int, neighbours: int):
+        platform = Platform(x, y, neighbours)
+        level.platforms.add(platform)
+        level.all_sprites.add(platform)
+        level.static_sprites.add(platform)
+        level.entry_sprites.setdefault(('platform', x, y, None), []).append(platform)
+        return platform
+
+    @staticmethod
+    def add_object(level: Level, obj_type: str, x: int, y: int, extra, covered: bool = False):
+        #one non-platform entry; covered only matters for spikes
+        if obj_type == 'spike':
+            sprite = Spike(x, y, covered)
+            level.spikes.add(sprite)
+            level.static_sprites.add(sprite)
+            level.triggers.add("spike", sprite)
+        elif obj_type == 'teleport':
+            sprite = Teleporter(x, y, int(extra))
+            level.teleporters.add(sprite)
+            level.static_sprites.add(sprite)
+            level.triggers.add("teleport", sprite)
+        elif obj_type == 'orb':
+            sprite = Orb(x, y)
+            level.orbs.add(sprite)
+            level.add_dynamic(sprite)
+            level.triggers.add("orb", sprite)
+        elif obj_type == 'sign':
+            sprite = Sign(x, y, extra)
+            level.signs.add(sprite)
+            level.static_sprites.add(sprite)
+            level.triggers.add("sign", sprite, sprite.detection_radius)
+        elif obj_type == 'checkpoint':
+            sprite = Checkpoint(x, y)
+            level.checkpoints.add(sprite)
+            level.add_dynamic(sprite)
+            level.triggers.add("checkpoint", sprite)
+        elif obj_type == 'boss':
+            boss_speed = float(extra) if extra is not None else 3.0
+            sprite = Boss(x, y, boss_speed)
+            level.bosses.add(sprite)
+            level.add_dynamic(sprite)
+        else:
+            return None
+        level.all_sprites.add(sprite)
+        level.entry_sprites.setdefault((obj_type, x, y, extra), []).append(sprite)
+        return sprite
 
-        level.player = Player(400, 300, level_num)
+    @staticmethod
+    def build(data: LevelData) -> Level:
+        #the sprite half of loading, on the main thread
+        level = Level()
+        level.level_num = data.level_num
+
+        # Najpierw platformy
+        for x, y in data.platforms:
+            LevelLoader.add_platform(level, x, y, data.platform_neighbours[(x, y)])
+        LevelLoader.build_platform_colliders(level, data.collider_rects)
+
+        # Potem reszta
+        for obj_type, x, y, extra in data.objects:
+            LevelLoader.add_object(level, obj_type, x, y, extra, (x, y) in data.covered_spikes)
+
+        level.player = Player(400, 300, data.level_num)
         level.all_sprites.add(level.player)
+        level.add_dynamic(level.player)
         return level
+
+    @staticmethod
+    def check_extra(obj_type: str, extra) -> None:
+        #raises ValueError for an entry add_object could not build
+        if obj_type == 'teleport':
+            if extra is None:
+                raise ValueError("teleport has no target level")
+            int(extra)
+        elif obj_type == 'sign' and extra is None:
+            raise ValueError("sign has no message key")
+        elif obj_type == 'boss' and extra is not None:
+            float(extra)
+
+    @staticmethod
+    def patch(level: Level, added, removed) -> tuple:
+        #applies a diff of level file entries (type, tile x, tile y, extra) to a running level:
+        #only those sprites are removed/created, then platform edges, spike orientation and
+        #colliders are redone for the new layout. the player is left alone.
+        #returns (world rects whose look changed, for re-baking static chunks,
+        #added entries that were left out because they are incomplete or malformed)
+        dirty = []
+        skipped = []
+        platforms_changed = False
+        checked = []
+        for entry in added:
+            try:
+                LevelLoader.check_extra(entry[0], entry[3])
+                checked.append(entry)
+            except ValueError as e:
+                skipped.append((entry, e))
+        added = checked
+
+        for obj_type, tile_x, tile_y, extra in removed:
+            x, y = LevelLoader.world_position(tile_x, tile_y)
+            key = (obj_type, x, y, None if obj_type == 'platform' else extra)
+            sprites = level.entry_sprites.get(key)
+            if not sprites:
+                continue
+            sprite = sprites.pop()
+            if not sprites:
+                del level.entry_sprites[key]
+            level.triggers.remove(sprite)
+            level.entity_grid.remove(sprite)
+            level.draw_order.pop(sprite, None)
+            if sprite is level.active_checkpoint:
+                level.active_checkpoint = None #the player keeps its reset position
+            if sprite is level.active_sign:
+                level.active_sign = None
+            sprite.kill()
+            dirty.append(sprite.rect.copy())
+            platforms_changed = platforms_changed or obj_type == 'platform'
+
+        new_objects = []
+        for obj_type, tile_x, tile_y, extra in added:
+            x, y = LevelLoader.world_position(tile_x, tile_y)
+            if obj_type == 'platform':
+                platform = LevelLoader.add_platform(level, x, y, 0)
+                dirty.append(platform.rect.copy())
+                platforms_changed = True
+            else:
+                new_objects.append((obj_type, x, y, extra))
+        for obj_type, x, y, extra in new_objects:
+            sprite = LevelLoader.add_object(level, obj_type, x, y, extra)
+            if sprite is not None:
+                dirty.append(sprite.rect.copy())
+
+        #same neighbour pass as loading, over what the level holds now
+        layout = LevelData(level.level_num)
+        layout.platforms = [platform.rect.topleft for platform in level.platforms]
+        layout.objects = [('spike', spike.rect.x, spike.rect.y, None) for spike in level.spikes]
+        LevelLoader.analyse_neighbours(layout)
+        for platform in level.platforms:
+            if platform.set_neighbours(layout.platform_neighbours[platform.rect.topleft]):
+                dirty.append(platform.rect.copy())
+        for spike in level.spikes:
+            if spike.set_covered(spike.rect.topleft in layout.covered_spikes):
+                dirty.append(spike.rect.copy())
+        if platforms_changed:
+            LevelLoader.build_platform_colliders(level)
+        return dirty, skipped
+
+    @staticmethod
+    def load(level_num: int) -> Level:
+        return LevelLoader.build(LevelLoader.prepare(level_num))
+
+#runs LevelLoader.prepare on a daemon thread, started as soon as we know which level comes
+#next (story pages), so the play state only has to build sprites when the player gets there
+class LevelPreloader:
+    def __init__(self, level_num: int):
+        self.level_num = level_num
+        self.data = None
+        self.error = None
+        self.thread = threading.Thread(target=self._run, name=f"preload-level{level_num}", daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        try:
+            self.data = LevelLoader.prepare(self.level_num)
+        except Exception as e: #the synchronous load will hit (and report) the same problem
+            self.error = e
+
+    def result(self):
+        #prepared data if the worker is done, otherwise None and the caller loads it itself
+        if self.thread.is_alive():
+            return None
+        return self.data
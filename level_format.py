@@ -0,0 +1,102 @@
+import glob
+import os
+import struct
+import sys
+
+#compiled level files (.lvl): the same entries as levels/levelN.txt, stored so the loader
+#can read the whole file in one go instead of splitting and converting every line.
+#
+#layout (little endian):
+#  header  - magic, version, record count, extras count, tile bounds (min x, min y, max x, max y)
+#  records - one fixed 8 byte record per entry: type code, tile x, tile y, extras index (-1 = none)
+#  extras  - length-prefixed utf-8 strings: teleport targets, sign keys, boss speeds
+MAGIC = b"GPLV"
+VERSION = 1
+HEADER = struct.Struct("<4sHxxIIhhhh")
+RECORD = struct.Struct("<Bxhhh")
+EXTRA_LENGTH = struct.Struct("<H")
+
+OBJECT_TYPES = ["platform", "spike", "teleport", "orb", "sign", "checkpoint", "boss"]
+TYPE_CODES = {name: code for code, name in enumerate(OBJECT_TYPES)}
+COMPILED_EXTENSION = ".lvl"
+
+def compiled_path(source_path: str) -> str:
+    return os.path.splitext(source_path)[0] + COMPILED_EXTENSION
+
+def parse_text(path: str) -> list:
+    #text format: one "type,x,y[,extra]" per line, x/y in tiles
+    entries = []
+    with open(path, 'r') as f:
+        for line in f:
+            parts = line.strip().split(',')
+            if len(parts) < 3 or parts[0] not in TYPE_CODES:
+                continue
+            extra = parts[3] if len(parts) > 3 else None
+            entries.append((parts[0], int(parts[1]), int(parts[2]), extra))
+    return entries
+
+def write_compiled(path: str, entries: list) -> None:
+    extras = []
+    records = bytearray()
+    for obj_type, x, y, extra in entries:
+        extra_index = -1
+        if extra is not None:
+            extra_index = len(extras)
+            extras.append(extra.encode("utf-8"))
+        records += RECORD.pack(TYPE_CODES[obj_type], x, y, extra_index)
+
+    xs = [entry[1] for entry in entries] or [0]
+    ys = [entry[2] for entry in entries] or [0]
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(entries), len(extras), min(xs), min(ys), max(xs), max(ys)))
+        f.write(records)
+        for extra in extras:
+            f.write(EXTRA_LENGTH.pack(len(extra)))
+            f.write(extra)
+
+def read_compiled(path: str) -> list:
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    magic, version, record_count, extras_count, *_bounds = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a compiled level (version {VERSION})")
+
+    offset = HEADER.size
+    records_end = offset + record_count * RECORD.size
+    offset_extras = records_end
+    extras = []
+    for _ in range(extras_count):
+        (length,) = EXTRA_LENGTH.unpack_from(data, offset_extras)
+        offset_extras += EXTRA_LENGTH.size
+        extras.append(data[offset_extras:offset_extras + length].decode("utf-8"))
+        offset_extras += length
+
+    return [(OBJECT_TYPES[code], x, y, extras[extra_index] if extra_index >= 0 else None)
+            for code, x, y, extra_index in RECORD.iter_unpack(data[offset:records_end])]
+
+def read_level(source_path: str) -> list:
+    #prefer the compiled file when it is at least as new as the text it was built from
+    binary_path = compiled_path(source_path)
+    try:
+        binary_mtime = os.path.getmtime(binary_path)
+    except OSError:
+        return parse_text(source_path)
+    try:
+        if os.path.getmtime(source_path) > binary_mtime:
+            return parse_text(source_path)
+    except OSError:
+        pass #only the compiled file exists
+    return read_compiled(binary_path)
+
+def compile_level(source_path: str) -> str:
+    target = compiled_path(source_path)
+    write_compiled(target, parse_text(source_path))
+    return target
+
+#usage: python level_format.py [levels/level1.txt ...] - defaults to every levels/level*.txt
+if __name__ == "__main__":
+    sources = sys.argv[1:] or sorted(glob.glob(os.path.join("levels", "level*.txt")))
+    for source in sources:
+        target = compile_level(source)
+        print(f"{source} -> {target} ({os.path.getsize(source)} -> {os.path.getsize(target)} bytes)")
@@ -0,0 +1,46 @@
+import os
+from collections import Counter
+from constants import TICK_RATE
+from level_format import parse_text
+
+#dev mode: notices edits to a level's text file (saved from the Level Creator) while it is being
+#played. polls the modification time every interval seconds of updates and hands back only the
+#entries that changed, as (added, removed) lists of (type, x, y, extra) in tiles
+class LevelWatcher:
+    def __init__(self, level_num: int, interval: float = 0.5):
+        self.path = f'levels/level{level_num}.txt'
+        self.interval = max(1, int(interval * TICK_RATE))
+        self.countdown = self.interval
+        self.mtime = self._mtime()
+        self.entries = self._read() if self.mtime is not None else Counter()
+
+    def _mtime(self):
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def _read(self) -> Counter:
+        #Counter, a file may list the same entry twice and each one is a sprite
+        return Counter(parse_text(self.path))
+
+    def poll(self):
+        #call once per update; None when nothing changed (or it is not time to look yet)
+        self.countdown -= 1
+        if self.countdown > 0:
+            return None
+        self.countdown = self.interval
+        mtime = self._mtime()
+        if mtime is None or mtime == self.mtime:
+            return None
+        try:
+            entries = self._read()
+        except (OSError, ValueError):
+            return None #caught mid-save, try again on the next poll
+        self.mtime = mtime
+        added = list((entries - self.entries).elements())
+        removed = list((self.entries - entries).elements())
+        self.entries = entries
+        if not added and not removed:
+            return None
+        return added, removed
@@ -8,6 +8,13 @@ GRID_HEIGHT = 25
 SCREEN_WIDTH = GRID_WIDTH * TILE_SIZE
 SCREEN_HEIGHT = GRID_HEIGHT * TILE_SIZE
 
+# Elementy trzymane w kawałkach (chunkach) CHUNK_SIZE x CHUNK_SIZE kratek: każdy kawałek ma
+# własną wyrenderowaną powierzchnię, miniaturę i zapisany tekst, odświeżane tylko po zmianie
+CHUNK_SIZE = 16
+CHUNK_PIXELS = CHUNK_SIZE * TILE_SIZE
+THUMB_TILE = 4  # rozmiar kratki w trybie podglądu
+THUMB_PIXELS = CHUNK_SIZE * THUMB_TILE
+
 COLORS = {
     "checkpoint": (88, 88, 88),
     "platform": (150, 150, 150),
@@ -28,7 +35,9 @@ pygame.display.set_caption("Edytor poziomu - Nieskończona mapa")
 clock = pygame.time.Clock()
 
 x, y = 0, 0
-elements = {}
+chunks = {}  # (cx, cy) -> Chunk
+overview = False  # TAB: podgląd całej mapy z miniatur kawałków
+level_dirty = False  # czy jest coś do zapisania
 font = pygame.font.SysFont(None, 28)
 
 half_width = GRID_WIDTH // 2
@@ -40,6 +49,15 @@ key_states = {k: False for k in [
     pygame.K_b, pygame.K_e, pygame.K_n
 ]}
 
+PLACE_KEYS = {
+    pygame.K_z: "platform",
+    pygame.K_x: "spike",
+    pygame.K_c: "orb",
+    pygame.K_v: "teleport",
+    pygame.K_b: "sign",
+    pygame.K_n: "checkpoint"
+}
+
 move_timer = 0
 block_timer = 0
 move_delay = 100
@@ -53,47 +71,141 @@ move_press_times = {
     pygame.K_DOWN: None
 }
 
+class Chunk:
+    def __init__(self, cx, cy):
+        self.cx = cx
+        self.cy = cy
+        self.elements = {}  # (x, y) -> (typ, dodatkowe pole z pliku albo None)
+        self.surface = None  # widok w pełnym rozmiarze, None = do przerysowania
+        self.thumbnail = None
+        self.text = None  # linie do pliku poziomu
+
+    def changed(self):
+        self.surface = None
+        self.thumbnail = None
+        self.text = None
+
+    def render(self, tile):
+        # kratka (0, 0) kawałka jest w lewym dolnym rogu, bo y w poziomie rośnie do góry
+        surface = pygame.Surface((CHUNK_SIZE * tile, CHUNK_SIZE * tile), pygame.SRCALPHA)
+        for (ex, ey), (etype, _) in self.elements.items():
+            col = ex - self.cx * CHUNK_SIZE
+            row = CHUNK_SIZE - 1 - (ey - self.cy * CHUNK_SIZE)
+            surface.fill(COLORS.get(etype, (255, 255, 255)), (col * tile, row * tile, tile, tile))
+        return surface
+
+    def get_surface(self):
+        if self.surface is None:
+            self.surface = self.render(TILE_SIZE)
+        return self.surface
+
+    def get_thumbnail(self):
+        if self.thumbnail is None:
+            self.thumbnail = self.render(THUMB_TILE)
+        return self.thumbnail
+
+    def get_text(self):
+        if self.text is None:
+            lines = []
+            for (ex, ey), (etype, extra) in self.elements.items():
+                lines.append(f"{etype},{ex},{ey}" if extra is None else f"{etype},{ex},{ey},{extra}")
+            self.text = "".join(line + "\n" for line in lines)
+        return self.text
+
+def chunk_at(px, py, create=False):
+    key = (px // CHUNK_SIZE, py // CHUNK_SIZE)
+    chunk = chunks.get(key)
+    if chunk is None and create:
+        chunk = chunks[key] = Chunk(*key)
+    return chunk
+
+def place_element(px, py, etype, extra=None):
+    global level_dirty
+    chunk = chunk_at(px, py, create=True)
+    if (px, py) not in chunk.elements:
+        chunk.elements[(px, py)] = (etype, extra)
+        chunk.changed()
+        level_dirty = True
+
+def remove_element(px, py):
+    global level_dirty
+    chunk = chunk_at(px, py)
+    if chunk is not None and chunk.elements.pop((px, py), None) is not None:
+        chunk.changed()
+        level_dirty = True
+        if not chunk.elements:
+            del chunks[(chunk.cx, chunk.cy)]
+
 def load_level():
+    global level_dirty
     if not os.path.exists(LEVEL_FILENAME):
         print(f"Plik {LEVEL_FILENAME} nie istnieje. Tworzę nowy poziom.")
-        return {}
-    loaded_elements = {}
+        return
     with open(LEVEL_FILENAME, 'r') as f:
         for line in f:
             parts = line.strip().split(',')
-            if len(parts) != 3:
+            if len(parts) < 3:
                 continue
-            etype, xs, ys = parts
+            etype, xs, ys = parts[:3]
+            # cel teleportu, klucz tabliczki, prędkość bossa - zostają przy zapisie
+            extra = ",".join(parts[3:]) if len(parts) > 3 else None
             try:
                 px, py = int(xs), int(ys)
             except ValueError:
                 continue
             if etype == "teleporter":
                 etype = "teleport"
-            loaded_elements[(px, py)] = etype
-    return loaded_elements
+            place_element(px, py, etype, extra)
+    level_dirty = False
 
 def save_level():
-    with open(LEVEL_FILENAME, 'w') as f:
-        for (ex, ey), etype in elements.items():
-            f.write(f"{etype},{ex},{ey}\n")
+    # zapis tylko gdy coś się zmieniło; niezmienione kawałki mają gotowy tekst, a plik
+    # tymczasowy podmieniany jest na końcu, więc przerwany zapis nie psuje poziomu
+    global level_dirty
+    if not level_dirty:
+        return
+    temp_filename = LEVEL_FILENAME + ".tmp"
+    with open(temp_filename, 'w') as f:
+        f.write("".join(chunk.get_text() for chunk in chunks.values()))
+    os.replace(temp_filename, LEVEL_FILENAME)
+    level_dirty = False
 
-def draw_grid():
+def make_grid_overlay():
+    # siatka rysowana raz, potem tylko nakładana
+    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
     for row in range(GRID_HEIGHT):
         for col in range(GRID_WIDTH):
             rect = pygame.Rect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            pygame.draw.rect(screen, COLORS["grid"], rect, 1)
+            pygame.draw.rect(overlay, COLORS["grid"], rect, 1)
+    return overlay
+
+def draw_grid():
+    screen.blit(grid_overlay, (0, 0))
+
+def draw_chunks(tile, columns, rows, thumbnails):
+    # tylko kawałki, które widać; kursor jest na środku ekranu
+    cam_x_start = x - columns // 2
+    cam_y_start = y + rows // 2
+    chunk_pixels = CHUNK_SIZE * tile
+    for cx in range(cam_x_start // CHUNK_SIZE, (cam_x_start + columns - 1) // CHUNK_SIZE + 1):
+        for cy in range((cam_y_start - rows + 1) // CHUNK_SIZE, cam_y_start // CHUNK_SIZE + 1):
+            chunk = chunks.get((cx, cy))
+            if chunk is None:
+                continue
+            surface = chunk.get_thumbnail() if thumbnails else chunk.get_surface()
+            rel_x = cx * CHUNK_SIZE - cam_x_start
+            rel_y = cam_y_start - (cy * CHUNK_SIZE + CHUNK_SIZE - 1)
+            screen.blit(surface, (rel_x * tile, rel_y * tile))
 
 def draw_elements():
-    cam_x_start = x - half_width
-    cam_y_start = y + half_height
-    for (ex, ey), etype in elements.items():
-        rel_x = ex - cam_x_start
-        rel_y = cam_y_start - ey
-        if 0 <= rel_x < GRID_WIDTH and 0 <= rel_y < GRID_HEIGHT:
-            color = COLORS.get(etype, (255, 255, 255))
-            rect = pygame.Rect(rel_x * TILE_SIZE, rel_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            pygame.draw.rect(screen, color, rect)
+    draw_chunks(TILE_SIZE, GRID_WIDTH, GRID_HEIGHT, False)
+
+def draw_overview():
+    columns = SCREEN_WIDTH // THUMB_TILE
+    rows = SCREEN_HEIGHT // THUMB_TILE
+    draw_chunks(THUMB_TILE, columns, rows, True)
+    cursor = pygame.Rect(columns // 2 * THUMB_TILE, rows // 2 * THUMB_TILE, THUMB_TILE, THUMB_TILE)
+    pygame.draw.rect(screen, COLORS["player"], cursor.inflate(4, 4), 1)
 
 def draw_player():
     rect = pygame.Rect(half_width * TILE_SIZE, half_height * TILE_SIZE, TILE_SIZE, TILE_SIZE)
@@ -101,10 +213,21 @@ def draw_player():
 
 def draw_ui():
     # Statyczna pozycja tekstu
-    pos_text = font.render(f"Pozycja: ({x}, {y})", True, (255, 255, 255))
+    mode = " - podgląd" if overview else ""
+    pos_text = font.render(f"Pozycja: ({x}, {y}){mode}", True, (255, 255, 255))
     screen.blit(pos_text, (10, 10))  # Lewy górny róg
 
-elements = load_level()
+def move_cursor(key):
+    global x, y
+    # w podglądzie strzałki skaczą o cały kawałek
+    step = CHUNK_SIZE if overview else 1
+    if key == pygame.K_LEFT: x -= step
+    elif key == pygame.K_RIGHT: x += step
+    elif key == pygame.K_UP: y += step
+    elif key == pygame.K_DOWN: y -= step
+
+grid_overlay = make_grid_overlay()
+load_level()
 
 running = True
 while running:
@@ -113,9 +236,12 @@ while running:
     block_timer += dt
 
     screen.fill(COLORS["background"])
-    draw_elements()
-    draw_grid()
-    draw_player()
+    if overview:
+        draw_overview()
+    else:
+        draw_elements()
+        draw_grid()
+        draw_player()
     draw_ui()  # ← rysujemy UI na końcu, żeby było na wierzchu
     pygame.display.flip()
 
@@ -125,20 +251,13 @@ while running:
             if press_time is not None:
                 held_time = pygame.time.get_ticks() - press_time
                 if held_time >= move_initial_delay and move_timer >= move_delay:
-                    if key == pygame.K_LEFT: x -= 1
-                    elif key == pygame.K_RIGHT: x += 1
-                    elif key == pygame.K_UP: y += 1
-                    elif key == pygame.K_DOWN: y -= 1
+                    move_cursor(key)
                     move_timer = 0
 
     if block_timer >= block_delay:
-        if key_states[pygame.K_z]: elements.setdefault((x, y), "platform")
-        if key_states[pygame.K_x]: elements.setdefault((x, y), "spike")
-        if key_states[pygame.K_c]: elements.setdefault((x, y), "orb")
-        if key_states[pygame.K_v]: elements.setdefault((x, y), "teleport")
-        if key_states[pygame.K_b]: elements.setdefault((x, y), "sign")
-        if key_states[pygame.K_n]: elements.setdefault((x, y), "checkpoint")
-        if key_states[pygame.K_e]: elements.pop((x, y), None)
+        for key, etype in PLACE_KEYS.items():
+            if key_states[key]: place_element(x, y, etype)
+        if key_states[pygame.K_e]: remove_element(x, y)
         block_timer = 0
 
     for event in pygame.event.get():
@@ -149,21 +268,15 @@ while running:
             if event.key == pygame.K_ESCAPE:
                 save_level()
                 running = False
+            if event.key == pygame.K_TAB:
+                overview = not overview
             if event.key in key_states:
                 key_states[event.key] = True
                 if event.key in move_press_times:
                     move_press_times[event.key] = pygame.time.get_ticks()
-                if event.key == pygame.K_LEFT: x -= 1
-                elif event.key == pygame.K_RIGHT: x += 1
-                elif event.key == pygame.K_UP: y += 1
-                elif event.key == pygame.K_DOWN: y -= 1
-                elif event.key == pygame.K_z: elements.setdefault((x, y), "platform")
-                elif event.key == pygame.K_x: elements.setdefault((x, y), "spike")
-                elif event.key == pygame.K_c: elements.setdefault((x, y), "orb")
-                elif event.key == pygame.K_v: elements.setdefault((x, y), "teleport")
-                elif event.key == pygame.K_b: elements.setdefault((x, y), "sign")
-                elif event.key == pygame.K_n: elements.setdefault((x, y), "checkpoint")
-                elif event.key == pygame.K_e: elements.pop((x, y), None)
+                if event.key in move_press_times: move_cursor(event.key)
+                elif event.key in PLACE_KEYS: place_element(x, y, PLACE_KEYS[event.key])
+                elif event.key == pygame.K_e: remove_element(x, y)
         elif event.type == pygame.KEYUP:
             if event.key in key_states:
                 key_states[event.key] = False
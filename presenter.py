@@ -0,0 +1,32 @@
+import pygame
+
+#the one place the window gets presented, once per frame. states either mark the whole
+#screen (play redraws everything anyway) or just the rectangles they changed, and an idle
+#menu marks nothing, so nothing is drawn or pushed to the display at all
+class Presenter:
+    def __init__(self):
+        self.full = True
+        self.rects = []
+        self.generation = 0 #bumped when whatever is on screen can no longer be trusted
+
+    def invalidate(self) -> None:
+        #state switch, resize, window exposed: every state has to draw itself in full again
+        self.generation += 1
+        self.full = True
+
+    def mark_full(self) -> None:
+        self.full = True
+
+    def mark(self, rect: pygame.Rect) -> None:
+        if not self.full:
+            self.rects.append(pygame.Rect(rect))
+
+    def present(self) -> None:
+        if self.full:
+            pygame.display.flip()
+        elif self.rects:
+            pygame.display.update(self.rects)
+        self.full = False
+        self.rects = []
+
+PRESENTER = Presenter()
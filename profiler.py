@@ -0,0 +1,110 @@
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+import pygame
+from constants import COLORS
+from font_manager import FONTS
+
+#colours for the top-level phases in the frame graph, sub-phases ("draw.hud") only show in the breakdown
+PHASE_COLORS = {
+    "events": (80, 160, 255),
+    "update": (80, 220, 120),
+    "draw": (240, 200, 60),
+    "present": (220, 90, 220),
+}
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        phases = self.profiler._current
+        phases[self.name] = phases.get(self.name, 0.0) + time.perf_counter() - self.start
+
+#optional per-frame timing: keeps the last few seconds of frames in a ring buffer and draws
+#a frame-time graph with a per-phase breakdown. when disabled, phase() hands back a shared
+#do-nothing context manager, so instrumented code costs one attribute check per phase
+class FrameProfiler:
+    def __init__(self, seconds: int = 5, fps: int = 60):
+        self.enabled = False
+        self.frames = deque(maxlen=seconds * fps) #one dict per frame: phase name -> seconds, "frame" = total
+        self._current = {}
+        self._frame_start = 0.0
+        self._null = nullcontext()
+        self._breakdown = [] #text lines, refreshed a couple of times a second rather than every frame
+        self._breakdown_age = 0
+
+    def toggle(self) -> None:
+        self.enabled = not self.enabled
+        self.frames.clear()
+        self._frame_start = 0.0 #toggled mid-frame, start recording from the next begin_frame
+
+    def phase(self, name: str):
+        if not self.enabled:
+            return self._null
+        return _Phase(self, name)
+
+    def begin_frame(self) -> None:
+        if self.enabled:
+            self._current = {}
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        if self.enabled and self._frame_start:
+            self._current["frame"] = time.perf_counter() - self._frame_start
+            self.frames.append(self._current)
+
+    def averages(self) -> dict:
+        totals = {}
+        for frame in self.frames:
+            for name, seconds in frame.items():
+                totals[name] = totals.get(name, 0.0) + seconds
+        count = max(1, len(self.frames))
+        return {name: total / count for name, total in totals.items()}
+
+    def dump(self, path: str = "profiler_dump.json") -> None:
+        with open(path, "w") as f:
+            json.dump({"frames_ms": [{name: seconds * 1000 for name, seconds in frame.items()} for frame in self.frames],
+                       "average_ms": {name: seconds * 1000 for name, seconds in self.averages().items()}}, f, indent=1)
+        print(f"Profiler buffer written to {path}")
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if not self.enabled:
+            return
+        width, height = 300, 100
+        panel = pygame.Rect(surface.get_width() - width - 10, surface.get_height() - height - 10, width, height)
+        overlay = pygame.Surface(panel.size, pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        surface.blit(overlay, panel)
+
+        #one column per buffered frame, stacked by top-level phase; 33ms fills the panel
+        scale = height / 0.033
+        bar_width = width / self.frames.maxlen
+        for i, frame in enumerate(self.frames):
+            x = panel.x + i * bar_width
+            y = panel.bottom
+            for name, color in PHASE_COLORS.items():
+                bar = frame.get(name, 0.0) * scale
+                if bar >= 1:
+                    pygame.draw.rect(surface, color, (x, y - bar, max(1, bar_width), bar))
+                    y -= bar
+        target_y = panel.bottom - (1 / 60) * scale
+        pygame.draw.line(surface, COLORS["RED"], (panel.x, target_y), (panel.right, target_y))
+
+        self._breakdown_age -= 1
+        if self._breakdown_age <= 0:
+            averages = self.averages()
+            self._breakdown = [f"{name}: {seconds * 1000:.2f} ms" for name, seconds in sorted(averages.items())]
+            self._breakdown_age = 30
+        for i, line in enumerate(self._breakdown):
+            text_surf, _ = FONTS.render(line, 20, COLORS["WHITE"])
+            surface.blit(text_surf, (panel.x, panel.y - 16 * (len(self._breakdown) - i) - 4))
+
+PROFILER = FrameProfiler()
@@ -0,0 +1,77 @@
+import struct
+import zlib
+from simulation import InputFrame
+
+#input recordings (.rec): a header, then one record per update with the input bits and a
+#checksum of the player state after that update. records are appended as the game runs,
+#so a recording cut short by a crash is still readable up to the last whole record
+MAGIC = b"GPRP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI") #magic, version, level, speedline seed
+RECORD = struct.Struct("<BI") #input bits, state checksum
+
+#bit order in the input byte; zoom presses only change the view but are kept so replays look the same
+INPUT_BITS = ("left", "right", "sprint", "jump", "flip", "reset", "zoom_in", "zoom_out")
+
+def encode_input(frame: InputFrame, zoom_in: bool = False, zoom_out: bool = False) -> int:
+    values = [getattr(frame, name) for name in INPUT_BITS[:6]] + [zoom_in, zoom_out]
+    return sum(1 << bit for bit, value in enumerate(values) if value)
+
+def decode_input(bits: int):
+    #returns (InputFrame, zoom_in, zoom_out)
+    values = [bool(bits & (1 << bit)) for bit in range(len(INPUT_BITS))]
+    return InputFrame(*values[:6]), values[6], values[7]
+
+def state_checksum(level) -> int:
+    #crc of everything that feeds back into physics, to catch a replay drifting from its recording
+    player = level.player
+    data = struct.pack("<iidbbbdii", player.rect.x, player.rect.y, player.velocity_y,
+                       player.gravity_direction, player.on_ground, player.charged,
+                       player.current_speed, player.reset_x, player.reset_y)
+    data += bytes(orb.active for orb in level.orbs)
+    data += bytes(checkpoint.active for checkpoint in level.checkpoints)
+    data += b"".join(struct.pack("<ii", boss.rect.x, boss.rect.y) for boss in level.bosses)
+    return zlib.crc32(data)
+
+class InputRecorder:
+    def __init__(self, path: str, level_num: int, seed: int):
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, level_num, seed))
+
+    def record(self, bits: int, checksum: int) -> None:
+        self.file.write(RECORD.pack(bits, checksum))
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self.file.close()
+
+class InputReplay:
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, self.level_num, self.seed = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not an input recording (version {VERSION})")
+        body = data[HEADER.size:]
+        body = body[:len(body) - len(body) % RECORD.size] #drop a partly written last record
+        self.records = list(RECORD.iter_unpack(body))
+        self.position = 0
+        self.divergence = None #first tick whose checksum did not match the recording
+
+    @property
+    def finished(self) -> bool:
+        return self.position >= len(self.records)
+
+    def next_bits(self) -> int:
+        return self.records[self.position][0] if not self.finished else 0
+
+    def check(self, checksum: int) -> bool:
+        #call once per update after next_bits(); compares against the recording and moves on
+        if self.finished:
+            return True
+        expected = self.records[self.position][1]
+        if checksum != expected and self.divergence is None:
+            self.divergence = self.position
+            print(f"Replay diverged at tick {self.position}")
+        self.position += 1
+        return checksum == expected
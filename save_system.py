@@ -0,0 +1,151 @@
+import json
+import os
+import queue
+import threading
+import time
+from language_manager import LANG
+
+SAVE_VERSION = 2 #1: the old saves/save.json with just the player, 2: adds the version header and level state
+NUM_SLOTS = 3
+SAVE_DIR = "saves"
+
+#save slots: snapshot() copies the game state into plain data on the main thread, a worker thread
+#turns it into JSON and writes it to a temp file that then replaces the slot in one step, so a
+#crash mid-save leaves the previous save intact. slot 1 is the old saves/save.json
+class SaveSystem:
+    def __init__(self):
+        self.slot = 1 #slot the save/load buttons use
+        self._requests = queue.Queue()
+        self._results = queue.Queue() #(slot, error or None) for every finished write
+        self._thread = None
+
+    @staticmethod
+    def slot_path(slot: int) -> str:
+        name = "save.json" if slot == 1 else f"save{slot}.json"
+        return os.path.join(SAVE_DIR, name)
+
+    def next_slot(self) -> int:
+        self.slot = self.slot % NUM_SLOTS + 1
+        return self.slot
+
+    def exists(self, slot: int) -> bool:
+        return os.path.exists(self.slot_path(slot))
+
+    def slot_label(self) -> str:
+        key = "save_slot" if self.exists(self.slot) else "save_slot_empty"
+        return LANG.strings["ui"][key].format(self.slot)
+
+    @staticmethod
+    def snapshot(play_state) -> dict:
+        #everything needed to put the level back the way it is; plain lists and numbers only,
+        #so the worker never touches a live sprite
+        level = play_state.level
+        player = level.player
+        active_checkpoint = level.active_checkpoint
+        return {
+            "version": SAVE_VERSION,
+            "saved_at": time.time(),
+            "level": play_state.level_num,
+            #same fields as version 1
+            "player_x": player.rect.x,
+            "player_y": player.rect.y,
+            "reset_x": player.reset_x,
+            "reset_y": player.reset_y,
+            "gravity": player.gravity_direction,
+            "velocity_y": player.velocity_y,
+            "charged": player.charged,
+            "zoom": play_state.zoom,
+            "checkpoints": [[checkpoint.rect.x, checkpoint.rect.y, checkpoint.active] for checkpoint in level.checkpoints],
+            "active_checkpoint": list(active_checkpoint.rect.topleft) if active_checkpoint else None,
+            "orbs": [[orb.rect.x, orb.rect.y, orb.active, getattr(orb, "respawn_ticks", 0)] for orb in level.orbs],
+            "bosses": [[boss.rect.x, boss.rect.y, boss.active] for boss in level.bosses]
+        }
+
+    def save(self, slot: int, snapshot: dict) -> None:
+        #returns straight away, the result shows up in poll()
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+            self._thread.start()
+        self._requests.put((slot, snapshot))
+
+    def _run(self) -> None:
+        while True:
+            slot, snapshot = self._requests.get()
+            try:
+                self._write(self.slot_path(slot), snapshot)
+                self._results.put((slot, None))
+            except Exception as e:
+                self._results.put((slot, e))
+            finally:
+                self._requests.task_done()
+
+    @staticmethod
+    def _write(path: str, snapshot: dict) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(snapshot, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    def poll(self) -> list:
+        #finished writes since the last call, as (slot, error or None)
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def wait(self) -> None:
+        #blocks until queued saves are on disk, for quitting
+        if self._thread is not None and self._thread.is_alive():
+            self._requests.join()
+
+    def load(self, slot: int) -> dict:
+        with open(self.slot_path(slot), "r") as f:
+            data = json.load(f)
+        version = data.get("version", 1)
+        if version > SAVE_VERSION:
+            raise ValueError(f"save slot {slot} is from a newer version ({version})")
+        return data
+
+    @staticmethod
+    def restore(play_state, data: dict) -> None:
+        #puts a loaded save onto a freshly created GameStatePlay for data["level"]; version 1
+        #saves only have the player, the level then stays as it was loaded
+        level = play_state.level
+        player = level.player
+        player.set_position(data["player_x"], data["player_y"])
+        player.set_reset_position(data["reset_x"], data["reset_y"])
+        player.gravity_direction = data.get("gravity", 1)
+        player.velocity_y = data.get("velocity_y", 0)
+        player.charged = data.get("charged", True)
+        if "zoom" in data:
+            play_state.zoom = play_state.state_manager.zoom_level = data["zoom"]
+
+        #checkpoints and orbs are matched by position, so a save survives small level edits
+        checkpoints = {checkpoint.rect.topleft: checkpoint for checkpoint in level.checkpoints}
+        for x, y, active in data.get("checkpoints", ()):
+            checkpoint = checkpoints.get((x, y))
+            if checkpoint is not None and not active:
+                checkpoint.deactivate()
+        if data.get("active_checkpoint"):
+            level.active_checkpoint = checkpoints.get(tuple(data["active_checkpoint"]))
+
+        orbs = {orb.rect.topleft: orb for orb in level.orbs}
+        for x, y, active, respawn_ticks in data.get("orbs", ()):
+            orb = orbs.get((x, y))
+            if orb is not None and not active:
+                orb.deactivate()
+                orb.respawn_ticks = respawn_ticks
+
+        #bosses move, so they go by level order
+        for boss, (x, y, active) in zip(level.bosses, data.get("bosses", ())):
+            boss.rect.topleft = (x, y)
+            if active:
+                boss.activate()
+            level.entity_grid.move(boss)
+
+SAVES = SaveSystem()
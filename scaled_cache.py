@@ -0,0 +1,53 @@
+import pygame
+from collections import OrderedDict
+
+#scaled copies of sprite and chunk images for drawing the play view straight to the screen.
+#zoom moves in 0.1 steps, so copies are keyed by (surface, step); switching zoom keeps the
+#previous step (zooming back and forth is common) and drops the rest. a pixel budget evicts
+#the least recently used copies so big chunks at 2x zoom don't pile up over a long level.
+#like ASSETS, surfaces are keyed by identity - swap images rather than drawing onto them
+class ScaledCache:
+    def __init__(self, max_pixels: int = 24_000_000):
+        self.max_pixels = max_pixels
+        self.copies = OrderedDict() #(surface, step) -> scaled surface, oldest first
+        self.pixels = 0
+        self.step = None
+        self.previous_step = None
+
+    @staticmethod
+    def zoom_step(zoom: float) -> int:
+        return round(zoom * 10)
+
+    def set_zoom(self, zoom: float) -> None:
+        step = self.zoom_step(zoom)
+        if step == self.step:
+            return
+        self.previous_step, self.step = self.step, step
+        for key in [key for key in self.copies if key[1] not in (self.step, self.previous_step)]:
+            self._evict(key)
+
+    def _evict(self, key) -> None:
+        scaled = self.copies.pop(key)
+        self.pixels -= scaled.get_width() * scaled.get_height()
+
+    def get(self, surface: pygame.Surface, zoom: float) -> pygame.Surface:
+        step = self.zoom_step(zoom)
+        if step == 10:
+            return surface #1x needs no copy
+        key = (surface, step)
+        scaled = self.copies.get(key)
+        if scaled is not None:
+            self.copies.move_to_end(key)
+            return scaled
+        scale = step / 10
+        scaled = pygame.transform.scale(surface, (max(1, round(surface.get_width() * scale)),
+                                                  max(1, round(surface.get_height() * scale))))
+        self.copies[key] = scaled
+        self.pixels += scaled.get_width() * scaled.get_height()
+        while self.pixels > self.max_pixels and len(self.copies) > 1:
+            self._evict(next(iter(self.copies)))
+        return scaled
+
+    def clear(self) -> None:
+        self.copies.clear()
+        self.pixels = 0
@@ -0,0 +1,115 @@
+import os
+import pygame
+from collision_system import CollisionSystem, GameEvent
+from level import LevelLoader
+from profiler import PROFILER
+from constants import PLAYER_SPEED, SPRINT_SPEED, SPRINT_ACCELERATION
+
+#one update's worth of player input, independent of where it came from (keyboard, script, replay)
+class InputFrame:
+    __slots__ = ("left", "right", "sprint", "jump", "flip", "reset")
+
+    def __init__(self, left=False, right=False, sprint=False, jump=False, flip=False, reset=False):
+        self.left = left
+        self.right = right
+        self.sprint = sprint
+        self.jump = jump #jump, flip and reset are presses, the rest are held keys
+        self.flip = flip
+        self.reset = reset
+
+#level physics without any game state, window or keyboard: load a level, feed it input
+#frames and read back the player state and events. GameStatePlay runs its updates through this too
+class Simulation:
+    def __init__(self, level_num: int, level=None):
+        Simulation.ensure_display()
+        self.level_num = level_num
+        self.level = level if level is not None else LevelLoader.load(level_num)
+        self.tick = 0
+
+    @staticmethod
+    def ensure_display() -> None:
+        #sprites convert their images to the display format, so some display has to exist;
+        #without a window that is a 1x1 surface on SDL's dummy driver
+        if pygame.display.get_surface() is not None:
+            return
+        if not pygame.display.get_init():
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    def step(self, frame: InputFrame) -> list:
+        #advance one update, returns the GameEvents it produced
+        player = self.level.player
+        if frame.jump:
+            player.jump()
+        if frame.flip:
+            player.flip_gravity()
+        if frame.reset:
+            player.reset_position()
+
+        player.is_sprinting = frame.sprint
+        if player.is_sprinting:
+            player.current_speed = min(SPRINT_SPEED, player.current_speed + SPRINT_ACCELERATION)
+        else:
+            player.current_speed = max(PLAYER_SPEED, player.current_speed - SPRINT_ACCELERATION*1.2)
+
+        x_velocity = 0
+        if frame.left:
+            x_velocity -= player.current_speed
+        if frame.right:
+            x_velocity += player.current_speed
+
+        with PROFILER.phase("update.physics"):
+            player.update(x_velocity)
+            #overlaps from before this update (a reset, a level edit) are pushed out sideways first,
+            #the sweeps only stop movement into platforms the player is not already inside
+            self._handle_horizontal_collision()
+            player.apply_physics(self.level.platform_grid)
+        with PROFILER.phase("update.collision"):
+            events = CollisionSystem.handle_collisions(player, self.level)
+        self.level.orbs.update()
+        if player.just_flipped:
+            events.append(GameEvent("flip", player.gravity_direction))
+            player.reset_flip_flag()
+
+        for boss in self.level.bosses:
+            boss.update(player.rect)
+        self.tick += 1
+        return events
+
+    def _handle_horizontal_collision(self) -> None:
+        player = self.level.player
+        for platform in self.level.platform_grid.query(player.rect):
+            if player.rect.colliderect(platform.rect):
+                if player.rect.centerx < platform.rect.centerx:
+                    player.rect.right = platform.rect.left
+                else:
+                    player.rect.left = platform.rect.right
+
+    def run(self, frames, ticks: int = None, stop_on=("teleport", "boss")) -> list:
+        #steps through an iterable of InputFrames (at most `ticks` of them), returns (tick, event) pairs;
+        #stops early on any event kind in stop_on, where the real game would leave the level
+        log = []
+        for count, frame in enumerate(frames):
+            if ticks is not None and count >= ticks:
+                break
+            tick = self.tick
+            events = self.step(frame)
+            log.extend((tick, event) for event in events)
+            if any(event.kind in stop_on for event in events):
+                break
+        return log
+
+    def player_state(self) -> dict:
+        player = self.level.player
+        return {
+            "tick": self.tick,
+            "x": player.rect.x,
+            "y": player.rect.y,
+            "velocity_y": player.velocity_y,
+            "gravity": player.gravity_direction,
+            "on_ground": player.on_ground,
+            "charged": player.charged,
+            "reset_x": player.reset_x,
+            "reset_y": player.reset_y
+        }
@@ -0,0 +1,62 @@
+import pygame
+
+#uniform grid of buckets keyed by cell, used to find objects near a rect without scanning a whole group
+class SpatialGrid:
+    def __init__(self, cell_size: int = 30):
+        self.cell_size = cell_size
+        self.cells = {} #(col, row) -> list of objects
+        self._object_cells = {} #object -> cells it occupies
+
+    def cell_range(self, rect: pygame.Rect):
+        size = self.cell_size
+        #right/bottom are exclusive, so the last covered pixel is right-1/bottom-1
+        return (rect.left // size, (rect.right - 1) // size,
+                rect.top // size, (rect.bottom - 1) // size)
+
+    def insert(self, obj, rect: pygame.Rect = None) -> None:
+        rect = rect if rect is not None else obj.rect
+        left, right, top, bottom = self.cell_range(rect)
+        occupied = []
+        for col in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                self.cells.setdefault((col, row), []).append(obj)
+                occupied.append((col, row))
+        self._object_cells[obj] = occupied
+
+    def move(self, obj, rect: pygame.Rect = None) -> None:
+        #re-bucket an object after it moved; nothing to do while it stays in the same cells
+        rect = rect if rect is not None else obj.rect
+        occupied = self._object_cells.get(obj)
+        if occupied is not None:
+            left, right, top, bottom = self.cell_range(rect)
+            if occupied[0] == (left, top) and occupied[-1] == (right, bottom):
+                return
+            self.remove(obj)
+        self.insert(obj, rect)
+
+    def remove(self, obj) -> None:
+        for cell in self._object_cells.pop(obj, ()):
+            bucket = self.cells[cell]
+            bucket.remove(obj)
+            if not bucket:
+                del self.cells[cell]
+
+    def query(self, rect: pygame.Rect) -> list:
+        #every object whose cells overlap the rect, each reported once, in insertion order per cell
+        left, right, top, bottom = self.cell_range(rect)
+        found = []
+        seen = set()
+        for col in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                for obj in self.cells.get((col, row), ()):
+                    if obj not in seen:
+                        seen.add(obj)
+                        found.append(obj)
+        return found
+
+    def collide(self, rect: pygame.Rect) -> list:
+        #objects from query() whose rect actually overlaps
+        return [obj for obj in self.query(rect) if rect.colliderect(obj.rect)]
+
+    def __len__(self) -> int:
+        return len(self._object_cells)
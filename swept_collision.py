@@ -0,0 +1,71 @@
+import pygame
+from spatial_grid import SpatialGrid
+
+#swept AABB against the platform grid: instead of stepping the rect pixel by pixel,
+#work out the first pixel of movement at which it would touch a platform (time of impact)
+class SweptCollision:
+    @staticmethod
+    def _entry(near_gap: int, far_gap: int, distance: int) -> int:
+        #first step k in 1..distance where the moving rect overlaps the platform, or 0 if none
+        #near_gap: pixels between the leading edge and the platform's near face (negative if overlapping)
+        #far_gap: pixels between the trailing edge and the platform's far face
+        k = max(1, near_gap + 1)
+        if k <= distance and k < far_gap:
+            return k
+        return 0
+
+    @staticmethod
+    def sweep_x(rect: pygame.Rect, dx: int, platforms: SpatialGrid):
+        #returns (distance the rect can travel, platform hit or None); platforms the rect
+        #already overlaps are left to the caller, same as the old push-out on centers
+        if dx == 0:
+            return 0, None
+        distance = abs(dx)
+        best_k, best = 0, None
+        for platform in platforms.query(rect.union(rect.move(dx, 0))):
+            p = platform.rect
+            if rect.top >= p.bottom or rect.bottom <= p.top or rect.colliderect(p):
+                continue
+            if dx > 0:
+                k = SweptCollision._entry(p.left - rect.right, p.right - rect.left, distance)
+            else:
+                k = SweptCollision._entry(rect.left - p.right, rect.right - p.left, distance)
+            if k and (best is None or k < best_k):
+                best_k, best = k, platform
+        if best is None:
+            return dx, None
+        #stop flush against the face that was hit
+        travel = best_k - 1
+        return (travel if dx > 0 else -travel), best
+
+    @staticmethod
+    def sweep_y(rect: pygame.Rect, dy: int, platforms: SpatialGrid):
+        #returns (pixels moved before the first overlapping step, platform hit or None)
+        #matches the old per-pixel loop, including hits on platforms already overlapped
+        if dy == 0:
+            return 0, None
+        distance = abs(dy)
+        best_k, best = 0, None
+        for platform in platforms.query(rect.union(rect.move(0, dy))):
+            p = platform.rect
+            if rect.left >= p.right or rect.right <= p.left:
+                continue
+            if dy > 0:
+                k = SweptCollision._entry(p.top - rect.bottom, p.bottom - rect.top, distance)
+            else:
+                k = SweptCollision._entry(rect.top - p.bottom, rect.bottom - p.top, distance)
+            if k and (best is None or k < best_k):
+                best_k, best = k, platform
+        if best is None:
+            return dy, None
+        return (best_k if dy > 0 else -best_k), best
+
+    @staticmethod
+    def move(rect: pygame.Rect, dx: int, dy: int, platforms: SpatialGrid):
+        #resolve both axes in one pass, horizontal first; moves rect in place
+        #returns (platform hit horizontally, platform hit vertically)
+        moved_x, hit_x = SweptCollision.sweep_x(rect, dx, platforms)
+        rect.x += moved_x
+        moved_y, hit_y = SweptCollision.sweep_y(rect, dy, platforms)
+        rect.y += moved_y
+        return hit_x, hit_y
@@ -0,0 +1,9 @@
+import os
+import sys
+
+#tests run from anywhere without a window: the repo root goes on the path and
+#relative asset paths (levels/, assets/) resolve against it
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
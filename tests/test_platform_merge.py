@@ -0,0 +1,104 @@
+import glob
+import random
+import pygame
+import pytest
+from level import LevelLoader, Collider
+from level_format import parse_text
+from spatial_grid import SpatialGrid
+from swept_collision import SweptCollision
+from simulation import Simulation
+from entities.player import Player
+
+#merged platform colliders (user-009) have to collide exactly like one collider per tile
+LEVEL_FILES = sorted(glob.glob("levels/level*.txt"))
+TILE = 30
+
+def platform_tiles(path: str) -> set:
+    return {LevelLoader.world_position(x, y) for obj_type, x, y, _ in parse_text(path) if obj_type == 'platform'}
+
+def grids(tiles: set):
+    per_tile = SpatialGrid(TILE)
+    for x, y in tiles:
+        per_tile.insert(Collider(pygame.Rect(x, y, TILE, TILE)))
+    merged = SpatialGrid(TILE)
+    for rect in LevelLoader.merge_tiles(tiles):
+        merged.insert(Collider(pygame.Rect(rect)))
+    return per_tile, merged
+
+def start_rects(tiles: set, per_tile: SpatialGrid, seed: int, count: int = 400):
+    #player-sized rects near platforms, never already inside one (the simulation pushes those out first)
+    rng = random.Random(seed)
+    ordered = sorted(tiles)
+    rects = []
+    while len(rects) < count:
+        x, y = rng.choice(ordered)
+        rect = pygame.Rect(x + rng.randint(-150, 150), y + rng.randint(-150, 150), 30, 50)
+        if not per_tile.collide(rect):
+            rects.append(rect)
+    return rects
+
+def face(platform, axis_step: int, horizontal: bool):
+    #the side of the platform that was hit, which is what the player gets snapped or stopped against
+    if platform is None:
+        return None
+    if horizontal:
+        return platform.rect.left if axis_step > 0 else platform.rect.right
+    return platform.rect.top if axis_step > 0 else platform.rect.bottom
+
+@pytest.mark.parametrize("path", LEVEL_FILES)
+def test_merge_covers_exactly_the_tiles(path):
+    tiles = platform_tiles(path)
+    rects = LevelLoader.merge_tiles(tiles)
+    assert sum(rect.width * rect.height for rect in rects) == len(tiles) * TILE * TILE
+    covered = set()
+    for rect in rects:
+        assert rect.width % TILE == 0 and rect.height % TILE == 0
+        for x in range(rect.left, rect.right, TILE):
+            for y in range(rect.top, rect.bottom, TILE):
+                assert (x, y) not in covered, f"{rect} overlaps another collider at {(x, y)}"
+                covered.add((x, y))
+    assert covered == tiles
+
+@pytest.mark.parametrize("path", LEVEL_FILES)
+@pytest.mark.parametrize("gravity", (1, -1))
+def test_swept_move_matches_per_tile(path, gravity):
+    tiles = platform_tiles(path)
+    if not tiles:
+        pytest.skip("no platforms")
+    per_tile, merged = grids(tiles)
+    rng = random.Random(f"{path} {gravity}")
+    for rect in start_rects(tiles, per_tile, rng.random()):
+        dx = rng.randint(-8, 8)
+        #mostly falling with gravity, sometimes jumping against it
+        dy = gravity * (rng.randint(1, 25) if rng.random() < 0.7 else -rng.randint(1, 13))
+        a, b = rect.copy(), rect.copy()
+        hit_xa, hit_ya = SweptCollision.move(a, dx, dy, per_tile)
+        hit_xb, hit_yb = SweptCollision.move(b, dx, dy, merged)
+        context = f"start {rect}, dx {dx}, dy {dy}"
+        assert a == b, context
+        assert face(hit_xa, dx, True) == face(hit_xb, dx, True), context
+        assert face(hit_ya, dy, False) == face(hit_yb, dy, False), context
+
+@pytest.mark.parametrize("path", LEVEL_FILES)
+@pytest.mark.parametrize("gravity", (1, -1))
+def test_player_physics_matches_per_tile(path, gravity):
+    #the same through Player.apply_physics, which also snaps onto the hit face
+    tiles = platform_tiles(path)
+    if not tiles:
+        pytest.skip("no platforms")
+    Simulation.ensure_display()
+    per_tile, merged = grids(tiles)
+    rng = random.Random(f"{path} {gravity} player")
+    players = Player(0, 0, 1), Player(0, 0, 1)
+    for rect in start_rects(tiles, per_tile, rng.random(), 200):
+        velocity_y = gravity * rng.uniform(-12, 20)
+        dx = rng.randint(-8, 8)
+        results = []
+        for player, grid in zip(players, (per_tile, merged)):
+            player.rect = rect.copy()
+            player.gravity_direction = gravity
+            player.velocity_y = velocity_y
+            player.pending_dx = dx
+            player.apply_physics(grid)
+            results.append((tuple(player.rect), player.velocity_y, player.on_ground))
+        assert results[0] == results[1], f"start {rect}, dx {dx}, velocity {velocity_y}"
@@ -0,0 +1,80 @@
+import pygame
+from spatial_grid import SpatialGrid
+
+class Trigger:
+    __slots__ = ("kind", "entity", "rect", "radius", "index")
+
+    def __init__(self, kind: str, entity, rect: pygame.Rect, radius: float, index: int):
+        self.kind = kind
+        self.entity = entity
+        self.rect = rect #volume in the grid; for radius triggers the circle's bounding box
+        self.radius = radius
+        self.index = index #registration order, so overlapping triggers fire in level file order
+
+    def contains(self, player_rect: pygame.Rect) -> bool:
+        if self.radius is None:
+            return self.rect.colliderect(player_rect)
+        #signs: the player's centre within radius of the sign's centre
+        return pygame.math.Vector2(self.entity.rect.center).distance_to(player_rect.center) < self.radius
+
+#trigger volumes (spikes, orbs, checkpoints, teleporters, sign radii) registered once in a
+#spatial grid. the triggers near the player are only looked up again when the player's rect
+#moves into different cells; every update then only tests those few candidates and reports
+#enter/stay/exit per trigger to handlers, so the cost follows what is nearby, not level size
+class TriggerSystem:
+    ORDER = ("teleport", "spike", "orb", "sign", "checkpoint") #kinds are handled in this order every update
+
+    def __init__(self, cell_size: int = 60):
+        self.grid = SpatialGrid(cell_size)
+        self.triggers = {} #entity -> Trigger
+        self.inside = {kind: [] for kind in self.ORDER} #triggers the player was in after the last update
+        self._count = 0
+        self._cells = None
+        self._candidates = {}
+
+    def add(self, kind: str, entity, radius: float = None) -> None:
+        if radius is None:
+            rect = entity.rect.copy()
+        else:
+            rect = pygame.Rect(0, 0, radius * 2, radius * 2)
+            rect.center = entity.rect.center
+        trigger = Trigger(kind, entity, rect, radius, self._count)
+        self._count += 1
+        self.triggers[entity] = trigger
+        self.grid.insert(trigger, rect)
+        self._cells = None
+
+    def remove(self, entity) -> None:
+        trigger = self.triggers.pop(entity, None)
+        if trigger is not None:
+            self.grid.remove(trigger)
+            self.inside[trigger.kind] = [inside for inside in self.inside[trigger.kind] if inside is not trigger]
+            self._cells = None
+
+    def _refresh(self, rect: pygame.Rect) -> None:
+        cells = self.grid.cell_range(rect)
+        if cells == self._cells:
+            return
+        self._cells = cells
+        self._candidates = {}
+        for trigger in sorted(self.grid.query(rect), key=lambda trigger: trigger.index):
+            self._candidates.setdefault(trigger.kind, []).append(trigger)
+
+    def update(self, player, handlers: dict, *args) -> None:
+        #handlers: kind -> (on_enter, on_stay, on_exit), each called as handler(entity, player, *args)
+        #or None. a handler can move the player (spikes reset it), so every kind looks again
+        for kind in self.ORDER:
+            self._refresh(player.rect)
+            now = [trigger for trigger in self._candidates.get(kind, ()) if trigger.contains(player.rect)]
+            previous = self.inside[kind]
+            self.inside[kind] = now
+            on_enter, on_stay, on_exit = handlers.get(kind, (None, None, None))
+            if on_exit:
+                for trigger in previous:
+                    if trigger not in now:
+                        on_exit(trigger.entity, player, *args)
+            for trigger in now:
+                handler = on_stay if trigger in previous else on_enter
+                #an earlier handler may have moved the player out already
+                if handler and trigger.contains(player.rect):
+                    handler(trigger.entity, player, *args)
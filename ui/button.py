@@ -1,5 +1,6 @@
 import pygame
 from constants import COLORS
+from font_manager import FONTS
 
 #stuff for buttons
 
@@ -10,6 +11,7 @@ class Button:
         self.text = text
         self.action = action
         self.is_hovered = False
+        self.dirty = True #needs drawing again
 
         #colors with defaults
         self.text_color = text_color or COLORS["BUTTON_TEXT"]
@@ -17,7 +19,10 @@ class Button:
         self.hover_color = hover_color or COLORS["BUTTON_HOVER"]
 
     def check_hover(self, mouse_pos):
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        hovered = self.rect.collidepoint(mouse_pos)
+        if hovered != self.is_hovered:
+            self.is_hovered = hovered
+            self.dirty = True
 
     def draw(self, surface: pygame.Surface):
         #draw background
@@ -25,10 +30,11 @@ class Button:
         pygame.draw.rect(surface, color, self.rect, border_radius=5)
         
         #draw text
-        font = pygame.freetype.Font('fonts/Silver.ttf',38)
-        text_surf, text_rect = font.render(self.text, self.text_color)
+        text_surf, text_rect = FONTS.render(self.text, 38, self.text_color)
         text_rect.center = self.rect.center
         surface.blit(text_surf, text_rect)
+        self.dirty = False
         
     def set_text(self, new_text):
-        self.text = new_text
\ No newline at end of file
+        self.text = new_text
+        self.dirty = True
\ No newline at end of file